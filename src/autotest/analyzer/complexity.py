@@ -2,55 +2,84 @@
 
 from __future__ import annotations
 
+import ast
+import functools
 import re
-from pathlib import Path
 
 from autotest.models.analysis import FunctionMetrics
 from autotest.models.project import Language
 
+# Common branching keywords across languages, fused into one alternation so each
+# function body is scanned once. "else if" precedes "if" so it counts as a single
+# branch. The ternary alternative stays last and is bounded (one line, no
+# nested "?", at most 200 chars) so "?" operators without a ":" scan linearly.
+_BRANCH_RE = re.compile(
+    r"\belse\s+if\b"
+    r"|\bif\b"
+    r"|\belif\b"
+    r"|\bfor\b"
+    r"|\bwhile\b"
+    r"|\bcase\b"
+    r"|\bcatch\b"
+    r"|\bexcept\b"
+    r"|&&"
+    r"|\|\|"
+    r"|\band\b"
+    r"|\bor\b"
+    r"|\?[^:\n?]{1,200}:"  # ternary operator
+)
+
 
 def calculate_complexity(func: FunctionMetrics) -> int:
     """Calculate cyclomatic complexity for a function."""
-    if func.language == Language.PYTHON:
-        return _python_complexity(func)
-    return _generic_complexity(func)
+    return _complexity_for_source(func.source_code, func.language == Language.PYTHON)
+
+
+def calculate_complexity_for_tree(tree: ast.Module) -> dict[int, int]:
+    """Score every function in a parsed Python module in one visitor pass.
+
+    Returns a map of definition line -> complexity, covering methods, nested
+    classes and closures. Empty if radon cannot visit the tree.
+    """
+    try:
+        from radon.visitors import ComplexityVisitor
+        visitor = ComplexityVisitor.from_ast(tree)
+    except Exception:
+        return {}
+
+    scores: dict[int, int] = {}
+    pending: list = [*visitor.functions, *visitor.classes]
+    while pending:
+        block = pending.pop()
+        if hasattr(block, "methods"):
+            pending.extend(block.methods)
+            pending.extend(block.inner_classes)
+        else:
+            scores[block.lineno] = block.complexity
+            pending.extend(block.closures)
+    return scores
+
+
+@functools.lru_cache(maxsize=8192)
+def _complexity_for_source(source: str, is_python: bool) -> int:
+    """Cached complexity of a function body; unchanged bodies are scored once."""
+    if is_python:
+        return _python_complexity(source)
+    return _generic_complexity(source)
 
 
-def _python_complexity(func: FunctionMetrics) -> int:
+def _python_complexity(source: str) -> int:
     """Calculate complexity using radon for Python functions."""
     try:
         from radon.complexity import cc_visit
-        blocks = cc_visit(func.source_code)
+        blocks = cc_visit(source)
         if blocks:
             return blocks[0].complexity
     except Exception:
         pass
-    return _generic_complexity(func)
+    return _generic_complexity(source)
 
 
-def _generic_complexity(func: FunctionMetrics) -> int:
+def _generic_complexity(source: str) -> int:
     """Calculate complexity using branch-keyword counting (all languages)."""
-    source = func.source_code
-    complexity = 1  # Base complexity
-
-    # Common branching keywords across languages
-    branch_patterns = [
-        r"\bif\b",
-        r"\belif\b",
-        r"\belse\s+if\b",
-        r"\bfor\b",
-        r"\bwhile\b",
-        r"\bcase\b",
-        r"\bcatch\b",
-        r"\bexcept\b",
-        r"\b&&\b",
-        r"\b\|\|\b",
-        r"\band\b",
-        r"\bor\b",
-        r"\?\s*[^:]+\s*:",  # ternary operator
-    ]
-
-    for pattern in branch_patterns:
-        complexity += len(re.findall(pattern, source))
-
-    return complexity
+    return 1 + sum(1 for _ in _BRANCH_RE.finditer(source))
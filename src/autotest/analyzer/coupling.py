@@ -2,24 +2,40 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+from collections import defaultdict
 
 from autotest.models.analysis import CouplingInfo, ModuleMetrics
 
 
 def calculate_coupling(modules: list[ModuleMetrics]) -> list[CouplingInfo]:
     """Calculate coupling metrics for all modules."""
+    # Index module paths once so each import resolves with dict lookups:
+    # by file stem, and by every trailing "a/b/c" run of path components
+    stem_index: dict[str, list[str]] = defaultdict(list)
+    slash_index: dict[str, list[str]] = defaultdict(list)
+    for module in modules:
+        path = module.file_path
+        mp = str(path)
+        stem_index[path.stem].append(mp)
+        parts = path.with_suffix("").parts
+        if parts and parts[-1] == "__init__":
+            parts = parts[:-1]
+        for i in range(len(parts)):
+            slash_index["/".join(parts[i:])].append(mp)
+
     # Build import graph
-    module_paths = {str(m.file_path) for m in modules}
     import_map: dict[str, set[str]] = {}
-    
     for module in modules:
-        import_map[str(module.file_path)] = set()
+        deps = import_map[str(module.file_path)] = set()
         for imp in module.imports:
-            # Try to resolve import to a module path
-            for mp in module_paths:
-                if imp.replace(".", "/") in mp or imp.split(".")[-1] in Path(mp).stem:
-                    import_map[str(module.file_path)].add(mp)
+            deps.update(slash_index.get(imp.replace(".", "/"), ()))
+            deps.update(stem_index.get(imp.rsplit(".", 1)[-1], ()))
+
+    # Reverse index: who imports each module
+    imported_by: dict[str, list[str]] = defaultdict(list)
+    for path, deps in import_map.items():
+        for dep in deps:
+            imported_by[dep].append(path)
 
     # Calculate afferent (incoming) and efferent (outgoing) coupling
     coupling_data: list[CouplingInfo] = []
@@ -31,16 +47,15 @@ def calculate_coupling(modules: list[ModuleMetrics]) -> list[CouplingInfo]:
         efferent = len(import_map.get(mp, set()))
         
         # Afferent: what depends on this module
-        afferent = sum(1 for deps in import_map.values() if mp in deps)
+        dependents = imported_by.get(mp, [])
+        afferent = len(dependents)
         
         # Instability: Ce / (Ca + Ce), 0 = stable, 1 = unstable
         total = afferent + efferent
         instability = efferent / total if total > 0 else 0.0
 
         # Update module with reverse deps
-        module.imported_by = [
-            path for path, deps in import_map.items() if mp in deps
-        ]
+        module.imported_by = list(dependents)
 
         coupling_data.append(CouplingInfo(
             module_path=module.file_path,
@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import re
-from pathlib import Path
 
 from autotest.models.analysis import FunctionMetrics
 from autotest.models.project import LanguageInfo
 from autotest.utils.file_utils import safe_read
 
+_WORD_RE = re.compile(r"\w+")
+_SPEC_PREFIX_RE = re.compile(r"(?:it|describe)\.\*(?=(\w+))")
+_ASSERTION_RE = re.compile(r"assert|expect|mock|spy|stub")
+_CALL_RE = re.compile(r"\s*\(")
+
+# How far past a reference an assertion may appear (~10 lines)
+_ASSERTION_WINDOW = 500
+
 
 def find_untested_functions(
     functions: list[FunctionMetrics],
@@ -22,47 +29,84 @@ def find_untested_functions(
                 func.is_tested = False
         return [f for f in functions if f.is_public]
 
-    # Collect all test content
-    test_content = ""
+    # Lowercase each name once; matching below works on these keys only
+    public = [(f, f.name.lower()) for f in functions if f.is_public]
+    remaining = {name for _, name in public}
+    tested: set[str] = set()
+
+    # Scan test files one at a time instead of concatenating the corpus
     for test_file in language_info.existing_test_files:
-        test_content += safe_read(test_file).lower() + "\n"
+        if not remaining:
+            break
+        found = _find_tested_names(safe_read(test_file).lower(), remaining)
+        tested |= found
+        remaining -= found
 
     untested: list[FunctionMetrics] = []
-    for func in functions:
-        if not func.is_public:
-            continue
-
-        # Check if function name appears in test content
-        name_lower = func.name.lower()
-        patterns = [
-            f"test_{name_lower}",
-            f"test{name_lower}",
-            f"{name_lower}_test",
-            f"{name_lower}test",
-            f"should_{name_lower}",
-            f"it.*{name_lower}",
-            f"describe.*{name_lower}",
-        ]
-
-        is_tested = any(p in test_content for p in patterns)
-
-        # Check for direct references with assertion within ~10 lines (500 chars)
-        if not is_tested:
-            is_tested = bool(re.search(
-                rf"\b{re.escape(name_lower)}\b.{{0,500}}(?:assert|expect|mock|spy|stub)",
-                test_content,
-                re.DOTALL,
-            ))
-
-        # Check if function is called in test code (name followed by parenthesis)
-        if not is_tested:
-            is_tested = bool(re.search(
-                rf"\b{re.escape(name_lower)}\s*\(",
-                test_content,
-            ))
-
-        func.is_tested = is_tested
-        if not is_tested:
+    for func, name in public:
+        func.is_tested = name in tested
+        if not func.is_tested:
             untested.append(func)
 
     return untested
+
+
+def _find_tested_names(test_content: str, names: set[str]) -> set[str]:
+    """Return the names that the (lowercased) test content exercises.
+
+    Each check is a single pass over the test content rather than one
+    search per function name.
+    """
+    found: set[str] = set()
+
+    # Naming conventions (test_foo, testfoo, foo_test, should_foo) are pure
+    # word characters, so they can only occur inside one word token
+    for token in set(_WORD_RE.findall(test_content)):
+        found |= _names_in_token(token, names)
+    for match in _SPEC_PREFIX_RE.finditer(test_content):
+        found |= _prefixes_in(match.group(1), names)
+
+    # Direct references: a call, or an assertion shortly after the name
+    remaining = names - found
+    if not remaining:
+        return found
+    for match in _WORD_RE.finditer(test_content):
+        name = match.group()
+        if name not in remaining:
+            continue
+        end = match.end()
+        assertion = _ASSERTION_RE.search(test_content, end, end + _ASSERTION_WINDOW + 6)
+        if _CALL_RE.match(test_content, end) or (
+            assertion and assertion.start() <= end + _ASSERTION_WINDOW
+        ):
+            found.add(name)
+            remaining.discard(name)
+
+    return found
+
+
+def _names_in_token(token: str, names: set[str]) -> set[str]:
+    """Names adjacent to a "test"/"should_" marker inside a word token."""
+    hits: set[str] = set()
+    for marker in ("test", "should_"):
+        start = token.find(marker)
+        while start != -1:
+            after = token[start + len(marker):]
+            hits |= _prefixes_in(after, names)
+            if marker == "test":
+                if after.startswith("_"):
+                    hits |= _prefixes_in(after[1:], names)
+                before = token[:start]
+                hits |= _suffixes_in(before, names)
+                if before.endswith("_"):
+                    hits |= _suffixes_in(before[:-1], names)
+            start = token.find(marker, start + 1)
+    return hits
+
+
+def _prefixes_in(text: str, names: set[str]) -> set[str]:
+    return {text[:i] for i in range(1, len(text) + 1) if text[:i] in names}
+
+
+def _suffixes_in(text: str, names: set[str]) -> set[str]:
+    return {text[i:] for i in range(len(text)) if text[i:] in names}
@@ -4,25 +4,23 @@ from __future__ import annotations
 
 import ast
 import re
+from collections import Counter
+from collections.abc import Iterable
 from pathlib import Path
 
 from autotest.models.analysis import FunctionMetrics
 from autotest.models.project import Language
 from autotest.utils.file_utils import safe_read
 
+_WORD_RE = re.compile(r"\w+")
+
 
 def detect_dead_code(
     functions: list[FunctionMetrics],
-    all_source_files: list[Path],
+    all_source_files: Iterable[Path],
 ) -> list[FunctionMetrics]:
     """Detect potentially dead (unused) functions."""
-    # Collect all source content (excluding test files)
-    all_content = ""
-    for file_path in all_source_files:
-        all_content += safe_read(file_path) + "\n"
-
-    dead_functions: list[FunctionMetrics] = []
-
+    candidates: list[FunctionMetrics] = []
     for func in functions:
         if not func.is_public:
             continue
@@ -31,13 +29,30 @@ def detect_dead_code(
             continue
         if func.name.startswith("__") and func.name.endswith("__"):
             continue
+        candidates.append(func)
+
+    # A whole-word reference to an identifier is exactly one word token, so
+    # counting tokens replaces a search per name. Names with non-word
+    # characters (e.g. JavaScript "$") keep a per-name regex.
+    other_patterns = {
+        func.name: re.compile(rf"\b{re.escape(func.name)}\b")
+        for func in candidates
+        if not _WORD_RE.fullmatch(func.name)
+    }
+
+    # Stream source files (excluding test files) one at a time
+    counts: Counter[str] = Counter()
+    for file_path in all_source_files:
+        content = safe_read(file_path)
+        counts.update(_WORD_RE.findall(content))
+        for name, pattern in other_patterns.items():
+            counts[name] += len(pattern.findall(content))
 
-        # Count references to this function (excluding its own definition)
-        pattern = rf"\b{re.escape(func.name)}\b"
-        matches = re.findall(pattern, all_content)
-        
+    dead_functions: list[FunctionMetrics] = []
+
+    for func in candidates:
         # Subtract 1 for the definition itself, and 1 for each decorator/type hint usage
-        reference_count = len(matches) - 1
+        reference_count = counts[func.name] - 1
         
         if reference_count <= 0:
             func.is_dead_code = True
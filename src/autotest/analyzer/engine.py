@@ -2,26 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 from autotest.config import AutoTestConfig
 from autotest.models.analysis import AnalysisReport, FunctionMetrics, ModuleMetrics
-from autotest.models.project import Language, ProjectInfo
+from autotest.constants import PARALLEL_ANALYSIS_MIN_FILES
+from autotest.models.project import Language, LanguageInfo, ProjectInfo
 from autotest.analyzer.complexity import calculate_complexity
 from autotest.analyzer.coupling import calculate_coupling
 from autotest.analyzer.coverage_gap import find_untested_functions
 from autotest.analyzer.dead_code import detect_dead_code
+from autotest.analyzer.parse_cache import CACHE_FILENAME, ParseCache
 from autotest.analyzer.parsers.python_parser import PythonParser
 from autotest.analyzer.parsers.js_parser import JSParser
 from autotest.analyzer.parsers.java_parser import JavaParser
 from autotest.analyzer.parsers.go_parser import GoParser
 from autotest.analyzer.parsers.rust_parser import RustParser
 from autotest.analyzer.parsers.csharp_parser import CSharpParser
-from autotest.utils.file_utils import count_lines
+from autotest.utils.file_utils import count_source_lines, safe_read
 
 
 # Directories that contain test code, not production source
-_TEST_DIR_NAMES = {"tests", "test", "__tests__", "spec", "specs"}
+_TEST_DIR_NAMES = frozenset({"tests", "test", "__tests__", "spec", "specs"})
 
 
 # Parser mapping
@@ -36,6 +43,55 @@ PARSERS = {
 }
 
 
+def _analyze_file(file_path: Path, language: Language) -> ModuleMetrics:
+    """Parse one source file and score its functions.
+
+    Module-level so it can be shipped to a worker process.
+    """
+    # Read once and hand the same text to both parser passes and the LOC count
+    source = safe_read(file_path)
+    functions, imports = PARSERS[language].parse(file_path, source)
+
+    # Calculate complexity for each function (the Python parser already
+    # scored them from the module AST it built), accumulating sum and max
+    # for the module metrics in the same pass
+    needs_scoring = language != Language.PYTHON
+    total_complexity = 0
+    max_complexity = 0
+    for func in functions:
+        if needs_scoring:
+            func.cyclomatic_complexity = calculate_complexity(func)
+        complexity = func.cyclomatic_complexity
+        total_complexity += complexity
+        if complexity > max_complexity:
+            max_complexity = complexity
+    avg_complexity = total_complexity / len(functions) if functions else 0.0
+
+    return ModuleMetrics(
+        file_path=file_path,
+        language=language,
+        loc=count_source_lines(source),
+        functions=functions,
+        imports=imports,
+        average_complexity=round(avg_complexity, 2),
+        max_complexity=max_complexity,
+    )
+
+
+def _share_strings(module: ModuleMetrics) -> None:
+    """Deduplicate strings repeated across the report.
+
+    Modules come back from worker processes or the parse cache as independent
+    copies, so intern names and imports and point every function at the
+    module's own Path.
+    """
+    module.imports = [sys.intern(imp) for imp in module.imports]
+    for func in module.functions:
+        func.name = sys.intern(func.name)
+        func.qualified_name = sys.intern(func.qualified_name)
+        func.file_path = module.file_path
+
+
 class AnalysisEngine:
     """Orchestrates code analysis across all detected languages."""
 
@@ -46,86 +102,76 @@ class AnalysisEngine:
         """Analyze all source files in the project."""
         all_modules: list[ModuleMetrics] = []
         all_functions: list[FunctionMetrics] = []
-        all_source_files: list[Path] = []
+        jobs: list[tuple[Path, Language]] = []
+        pending: list[tuple[LanguageInfo, int]] = []
+        root = project.root_path
+        is_in_test_dir = self._is_in_test_dir
 
         for lang_info in project.languages:
-            parser = PARSERS.get(lang_info.language)
-            if not parser:
+            language = lang_info.language
+            if language not in PARSERS:
                 continue
 
             # Build set for O(1) lookup
             test_files_set = set(lang_info.existing_test_files)
 
+            files = [
+                file_path for file_path in lang_info.files
+                # Skip test files, and (safety net) files inside test directories
+                if file_path not in test_files_set
+                and not is_in_test_dir(file_path, root)
+            ]
+            pending.append((lang_info, len(files)))
+            jobs.extend((file_path, language) for file_path in files)
+
+        modules = iter(await self._load_modules(jobs))
+
+        for lang_info, file_count in pending:
+            lang_modules = list(islice(modules, file_count))
+            for module in lang_modules:
+                _share_strings(module)
             # Track functions for this language only
-            lang_functions: list[FunctionMetrics] = []
-
-            for file_path in lang_info.files:
-                # Skip test files in analysis
-                if file_path in test_files_set:
-                    continue
-
-                # Safety net: skip files inside test directories
-                if self._is_in_test_dir(file_path, project.root_path):
-                    continue
-
-                all_source_files.append(file_path)
-                functions = parser.parse_functions(file_path)
-                imports = parser.parse_imports(file_path)
-
-                # Calculate complexity for each function
-                for func in functions:
-                    func.cyclomatic_complexity = calculate_complexity(func)
-
-                lang_functions.extend(functions)
-
-                # Build module metrics
-                avg_complexity = (
-                    sum(f.cyclomatic_complexity for f in functions) / len(functions)
-                    if functions else 0.0
-                )
-                max_complexity = (
-                    max(f.cyclomatic_complexity for f in functions)
-                    if functions else 0
-                )
-
-                module = ModuleMetrics(
-                    file_path=file_path,
-                    language=lang_info.language,
-                    loc=count_lines(file_path),
-                    functions=functions,
-                    imports=imports,
-                    average_complexity=round(avg_complexity, 2),
-                    max_complexity=max_complexity,
-                )
-                all_modules.append(module)
+            lang_functions = [f for m in lang_modules for f in m.functions]
 
             # Find untested functions for this language only
             find_untested_functions(lang_functions, lang_info)
+            all_modules.extend(lang_modules)
             all_functions.extend(lang_functions)
 
-        # Calculate coupling
-        coupling_data = calculate_coupling(all_modules)
-
-        # Find dead code
-        detect_dead_code(all_functions, all_source_files)
-
-        # Collect results
-        untested = [f for f in all_functions if f.is_public and not f.is_tested]
-        high_complexity = [
-            f for f in all_functions
-            if f.cyclomatic_complexity > self.config.complexity_threshold
-        ]
-        dead_code = [f for f in all_functions if f.is_dead_code]
-        tested_count = sum(1 for f in all_functions if f.is_tested)
-        total_public = sum(1 for f in all_functions if f.is_public)
+        # Coupling and dead-code detection are independent (they touch
+        # different fields), so run them side by side off the event loop
+        coupling_data, _ = await asyncio.gather(
+            asyncio.to_thread(calculate_coupling, all_modules),
+            asyncio.to_thread(
+                detect_dead_code, all_functions, [m.file_path for m in all_modules],
+            ),
+        )
+
+        # Collect results in a single pass over all functions
+        untested: list[FunctionMetrics] = []
+        high_complexity: list[FunctionMetrics] = []
+        dead_code: list[FunctionMetrics] = []
+        tested_count = 0
+        total_public = 0
+        cc_sum = 0
+        threshold = self.config.complexity_threshold
+        for f in all_functions:
+            cc_sum += f.cyclomatic_complexity
+            if f.is_public:
+                total_public += 1
+                if not f.is_tested:
+                    untested.append(f)
+            if f.cyclomatic_complexity > threshold:
+                high_complexity.append(f)
+            if f.is_dead_code:
+                dead_code.append(f)
+            if f.is_tested:
+                tested_count += 1
         estimated_coverage = (tested_count / total_public * 100) if total_public > 0 else 0.0
 
         # Aggregate metrics
         total_loc = sum(m.loc for m in all_modules)
-        avg_cc = (
-            sum(f.cyclomatic_complexity for f in all_functions) / len(all_functions)
-            if all_functions else 0.0
-        )
+        avg_cc = cc_sum / len(all_functions) if all_functions else 0.0
 
         return AnalysisReport(
             modules=all_modules,
@@ -140,6 +186,36 @@ class AnalysisEngine:
             total_loc=total_loc,
         )
 
+    async def _load_modules(self, jobs: list[tuple[Path, Language]]) -> list[ModuleMetrics]:
+        """Reuse cached metrics for unchanged files and analyze the rest."""
+        if not self.config.analysis_cache:
+            return await self._analyze_files(jobs)
+
+        cache = ParseCache(self.config.output_dir / CACHE_FILENAME)
+        try:
+            results = [cache.get(file_path, language) for file_path, language in jobs]
+            misses = [i for i, module in enumerate(results) if module is None]
+            fresh = await self._analyze_files([jobs[i] for i in misses])
+            for i, module in zip(misses, fresh, strict=True):
+                results[i] = module
+                cache.put(module)
+        finally:
+            cache.close()
+        return results
+
+    async def _analyze_files(self, jobs: list[tuple[Path, Language]]) -> list[ModuleMetrics]:
+        """Analyze files in input order, across a process pool for large projects."""
+        workers = self.config.analysis_workers or os.cpu_count() or 1
+        if workers <= 1 or len(jobs) < PARALLEL_ANALYSIS_MIN_FILES:
+            return [_analyze_file(file_path, language) for file_path, language in jobs]
+
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return await asyncio.gather(*(
+                loop.run_in_executor(pool, _analyze_file, file_path, language)
+                for file_path, language in jobs
+            ))
+
     @staticmethod
     def _is_in_test_dir(file_path: Path, root: Path) -> bool:
         """Check if file is inside a test directory."""
@@ -148,4 +224,5 @@ class AnalysisEngine:
         except ValueError:
             return False
         # Check directory parts only (exclude filename)
-        return any(part in _TEST_DIR_NAMES for part in rel.parts[:-1])
+        parts = rel.parts
+        return len(parts) > 1 and not _TEST_DIR_NAMES.isdisjoint(parts[:-1])
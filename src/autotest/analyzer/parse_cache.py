@@ -0,0 +1,96 @@
+"""Persistent cache of per-file analysis results."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from autotest import __version__
+from autotest.models.analysis import ModuleMetrics
+from autotest.models.project import Language
+
+CACHE_FILENAME = ".autotest_cache.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS modules (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    version TEXT NOT NULL,
+    data TEXT NOT NULL
+)
+"""
+
+
+class ParseCache:
+    """SQLite store of each file's ModuleMetrics, keyed by (path, mtime_ns, size).
+
+    An entry is only returned while the file's fingerprint, the AutoTest
+    version and the language the file is analyzed as match what was stored;
+    anything else is a miss. The cache never
+    raises: if the database cannot be opened or read, every lookup misses.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self._conn: sqlite3.Connection | None = None
+        self._pending: list[tuple[str, int, int, str, str]] = []
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(db_path)
+            self._conn.execute(_SCHEMA)
+        except Exception:
+            self._conn = None
+
+    def get(self, file_path: Path, language: Language) -> ModuleMetrics | None:
+        """Return cached metrics for an unchanged file analyzed as language, or None."""
+        if self._conn is None:
+            return None
+        try:
+            stat = file_path.stat()
+            row = self._conn.execute(
+                "SELECT data FROM modules"
+                " WHERE path = ? AND mtime_ns = ? AND size = ? AND version = ?",
+                (str(file_path), stat.st_mtime_ns, stat.st_size, __version__),
+            ).fetchone()
+            if row is None:
+                return None
+            module = ModuleMetrics.model_validate_json(row[0])
+            # The detected language can flip (e.g. JavaScript vs TypeScript)
+            # without the file changing
+            return module if module.language == language else None
+        except Exception:
+            return None
+
+    def put(self, module: ModuleMetrics) -> None:
+        """Queue freshly computed metrics; they are written on close()."""
+        if self._conn is None:
+            return
+        try:
+            stat = module.file_path.stat()
+        except OSError:
+            return
+        self._pending.append((
+            str(module.file_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            __version__,
+            module.model_dump_json(),
+        ))
+
+    def close(self) -> None:
+        """Flush queued entries in one transaction and close the database."""
+        if self._conn is None:
+            return
+        try:
+            if self._pending:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO modules VALUES (?, ?, ?, ?, ?)",
+                        self._pending,
+                    )
+        except Exception:
+            pass
+        finally:
+            self._pending.clear()
+            self._conn.close()
+            self._conn = None
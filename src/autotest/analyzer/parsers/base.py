@@ -0,0 +1,109 @@
+"""Shared interface for language parsers."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+from autotest.models.analysis import FunctionMetrics
+from autotest.utils.file_utils import safe_read
+
+
+def newline_offsets(source: str) -> list[int]:
+    """Offsets of every newline in source, for line lookups with line_at()."""
+    offsets: list[int] = []
+    pos = source.find("\n")
+    while pos != -1:
+        offsets.append(pos)
+        pos = source.find("\n", pos + 1)
+    return offsets
+
+
+def line_at(offsets: list[int], pos: int) -> int:
+    """1-based line number of a character offset (binary search, not a rescan)."""
+    return bisect_right(offsets, pos) + 1
+
+
+def line_count(source: str, offsets: list[int]) -> int:
+    """Number of lines in source (a trailing newline does not start a new one)."""
+    return len(offsets) + (not source.endswith("\n"))
+
+
+def line_span(source: str, offsets: list[int], first: int, last: int) -> str:
+    """Text of lines first..last (1-based, inclusive), sliced straight from source."""
+    start = offsets[first - 2] + 1 if first > 1 else 0
+    end = offsets[last - 1] if last <= len(offsets) else len(source)
+    return source[start:end]
+
+
+_OPENERS = frozenset("<([{")
+_CLOSERS = frozenset(">)]}")
+
+
+@lru_cache(maxsize=4096)
+def count_params(params: str) -> int:
+    """Number of comma-separated parameters, ignoring commas nested in
+    generics, parentheses, brackets or braces (``Map<K, V> m`` is one)."""
+    count = 0
+    depth = 0
+    has_content = False
+    for ch in params:
+        if ch == "," and depth == 0:
+            count += has_content
+            has_content = False
+            continue
+        if ch in _OPENERS:
+            depth += 1
+        elif ch in _CLOSERS and depth:
+            # Unmatched closers (the '>' of '->' or '=>') are ordinary text.
+            depth -= 1
+        if not has_content and not ch.isspace():
+            has_content = True
+    return count + has_content
+
+
+class ParseResult(NamedTuple):
+    functions: list[FunctionMetrics]
+    imports: list[str]
+
+
+class SourceParser(ABC):
+    """Base class for language parsers.
+
+    Parsers work on source text that has already been read, so the analyzer
+    can read each file once and feed both passes through ``parse()``.
+    """
+
+    def parse(self, file_path: Path, source: str) -> ParseResult:
+        """Extract functions and imports from a file's source."""
+        if not source:
+            return ParseResult([], [])
+        return ParseResult(
+            self._parse_functions(file_path, source),
+            self._parse_imports(source),
+        )
+
+    def parse_functions(self, file_path: Path) -> list[FunctionMetrics]:
+        """Extract all functions from a file."""
+        source = safe_read(file_path)
+        if not source:
+            return []
+        return self._parse_functions(file_path, source)
+
+    def parse_imports(self, file_path: Path) -> list[str]:
+        """Extract all imports from a file."""
+        source = safe_read(file_path)
+        if not source:
+            return []
+        return self._parse_imports(source)
+
+    @abstractmethod
+    def _parse_functions(self, file_path: Path, source: str) -> list[FunctionMetrics]:
+        """Extract functions from non-empty source."""
+
+    @abstractmethod
+    def _parse_imports(self, source: str) -> list[str]:
+        """Extract imports from non-empty source."""
@@ -5,12 +5,19 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
+from autotest.analyzer.parsers.base import (
+    SourceParser,
+    count_params,
+    line_at,
+    line_count,
+    line_span,
+    newline_offsets,
+)
 from autotest.models.analysis import FunctionMetrics
 from autotest.models.project import Language
-from autotest.utils.file_utils import safe_read
 
 
-class CSharpParser:
+class CSharpParser(SourceParser):
     """Parse C# files using regex patterns."""
 
     METHOD_PATTERN = re.compile(
@@ -21,13 +28,10 @@ class CSharpParser:
 
     USING_PATTERN = re.compile(r"using\s+([\w.]+)\s*;", re.MULTILINE)
 
-    def parse_functions(self, file_path: Path) -> list[FunctionMetrics]:
-        source = safe_read(file_path)
-        if not source:
-            return []
-
+    def _parse_functions(self, file_path: Path, source: str) -> list[FunctionMetrics]:
         functions: list[FunctionMetrics] = []
-        lines = source.splitlines()
+        newlines = newline_offsets(source)
+        total_lines = line_count(source, newlines)
 
         for match in self.METHOD_PATTERN.finditer(source):
             name = match.group(1)
@@ -35,9 +39,9 @@ class CSharpParser:
                 continue
 
             params = match.group(2)
-            param_count = len([p for p in params.split(",") if p.strip()]) if params.strip() else 0
-            line_start = source[:match.start()].count("\n") + 1
-            line_end = min(line_start + 30, len(lines))
+            param_count = count_params(params)
+            line_start = line_at(newlines, match.start())
+            line_end = min(line_start + 30, total_lines)
 
             prefix = source[max(0, match.start() - 30):match.start()]
             is_public = "public" in prefix
@@ -49,15 +53,12 @@ class CSharpParser:
                 line_start=line_start,
                 line_end=line_end,
                 language=Language.CSHARP,
-                source_code="\n".join(lines[line_start - 1:line_end]),
+                source_code=line_span(source, newlines, line_start, line_end),
                 parameters_count=param_count,
                 is_public=is_public,
             ))
 
         return functions
 
-    def parse_imports(self, file_path: Path) -> list[str]:
-        source = safe_read(file_path)
-        if not source:
-            return []
+    def _parse_imports(self, source: str) -> list[str]:
         return [m.group(1) for m in self.USING_PATTERN.finditer(source)]
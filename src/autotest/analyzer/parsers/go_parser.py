@@ -5,12 +5,19 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
+from autotest.analyzer.parsers.base import (
+    SourceParser,
+    count_params,
+    line_at,
+    line_count,
+    line_span,
+    newline_offsets,
+)
 from autotest.models.analysis import FunctionMetrics
 from autotest.models.project import Language
-from autotest.utils.file_utils import safe_read
 
 
-class GoParser:
+class GoParser(SourceParser):
     """Parse Go files using regex patterns."""
 
     FUNC_PATTERN = re.compile(
@@ -20,20 +27,17 @@ class GoParser:
 
     IMPORT_PATTERN = re.compile(r'"([\w./\-]+)"', re.MULTILINE)
 
-    def parse_functions(self, file_path: Path) -> list[FunctionMetrics]:
-        source = safe_read(file_path)
-        if not source:
-            return []
-
+    def _parse_functions(self, file_path: Path, source: str) -> list[FunctionMetrics]:
         functions: list[FunctionMetrics] = []
-        lines = source.splitlines()
+        newlines = newline_offsets(source)
+        total_lines = line_count(source, newlines)
 
         for match in self.FUNC_PATTERN.finditer(source):
             name = match.group(1)
             params = match.group(2)
-            param_count = len([p for p in params.split(",") if p.strip()]) if params.strip() else 0
-            line_start = source[:match.start()].count("\n") + 1
-            line_end = min(line_start + 25, len(lines))
+            param_count = count_params(params)
+            line_start = line_at(newlines, match.start())
+            line_end = min(line_start + 25, total_lines)
 
             is_public = name[0].isupper() if name else False
 
@@ -44,15 +48,12 @@ class GoParser:
                 line_start=line_start,
                 line_end=line_end,
                 language=Language.GO,
-                source_code="\n".join(lines[line_start - 1:line_end]),
+                source_code=line_span(source, newlines, line_start, line_end),
                 parameters_count=param_count,
                 is_public=is_public,
             ))
 
         return functions
 
-    def parse_imports(self, file_path: Path) -> list[str]:
-        source = safe_read(file_path)
-        if not source:
-            return []
+    def _parse_imports(self, source: str) -> list[str]:
         return [m.group(1) for m in self.IMPORT_PATTERN.finditer(source)]
@@ -5,73 +5,84 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
+from autotest.analyzer.parsers.base import (
+    SourceParser,
+    count_params,
+    line_at,
+    line_count,
+    line_span,
+    newline_offsets,
+)
 from autotest.models.analysis import FunctionMetrics
 from autotest.models.project import Language
-from autotest.utils.file_utils import safe_read
 
 
-class JSParser:
+class JSParser(SourceParser):
     """Parse JavaScript/TypeScript files using regex patterns."""
 
-    # Patterns for function detection
-    FUNCTION_PATTERNS = [
+    # Function detection: one alternation so each file is scanned once
+    FUNCTION_PATTERN = re.compile(
         # function name(params) {
-        re.compile(r"(?:export\s+)?(?:async\s+)?function\s+(\w+)\s*\(([^)]*)\)", re.MULTILINE),
+        r"(?:export\s+)?(?:async\s+)?function\s+(?P<fn_name>\w+)\s*\((?P<fn_params>[^)]*)\)"
         # const name = (params) => {
-        re.compile(r"(?:export\s+)?(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s+)?\(([^)]*)\)\s*=>", re.MULTILINE),
+        r"|(?:export\s+)?(?:const|let|var)\s+(?P<arrow_name>\w+)\s*=\s*(?:async\s+)?"
+        r"\((?P<arrow_params>[^)]*)\)\s*=>"
         # class methods: name(params) {
-        re.compile(r"^\s+(?:async\s+)?(\w+)\s*\(([^)]*)\)\s*\{", re.MULTILINE),
-    ]
+        r"|^\s+(?:async\s+)?(?P<method_name>\w+)\s*\((?P<method_params>[^)]*)\)\s*\{",
+        re.MULTILINE,
+    )
+
+    # Priority order of the FUNCTION_PATTERN forms
+    _KINDS = ("fn", "arrow", "method")
 
     IMPORT_PATTERN = re.compile(
         r"(?:import\s+.*?from\s+['\"]([^'\"]+)['\"]|require\s*\(\s*['\"]([^'\"]+)['\"]\s*\))",
         re.MULTILINE,
     )
 
-    def parse_functions(self, file_path: Path) -> list[FunctionMetrics]:
-        source = safe_read(file_path)
-        if not source:
-            return []
-
+    def _parse_functions(self, file_path: Path, source: str) -> list[FunctionMetrics]:
         is_ts = file_path.suffix in {".ts", ".tsx"}
         language = Language.TYPESCRIPT if is_ts else Language.JAVASCRIPT
         functions: list[FunctionMetrics] = []
-        lines = source.splitlines()
+        newlines = newline_offsets(source)
+        total_lines = line_count(source, newlines)
         seen_names: set[str] = set()
 
-        for pattern in self.FUNCTION_PATTERNS:
-            for match in pattern.finditer(source):
-                name = match.group(1)
-                if name in seen_names or name in {"if", "for", "while", "switch", "catch"}:
-                    continue
-                seen_names.add(name)
+        # One scan, bucketed by form; declarations win over arrow functions,
+        # which win over class methods, when a name appears more than once.
+        by_kind: dict[str, list[re.Match[str]]] = {kind: [] for kind in self._KINDS}
+        for match in self.FUNCTION_PATTERN.finditer(source):
+            kind = "fn" if match["fn_name"] else "arrow" if match["arrow_name"] else "method"
+            by_kind[kind].append(match)
 
-                params = match.group(2) if match.lastindex and match.lastindex >= 2 else ""
-                param_count = len([p for p in params.split(",") if p.strip()]) if params.strip() else 0
-                
-                line_start = source[:match.start()].count("\n") + 1
-                # Estimate end by finding matching brace
-                line_end = min(line_start + 20, len(lines))
+        for kind, match in ((k, m) for k in self._KINDS for m in by_kind[k]):
+            name = match[f"{kind}_name"]
+            if name in seen_names or name in {"if", "for", "while", "switch", "catch"}:
+                continue
+            seen_names.add(name)
 
-                functions.append(FunctionMetrics(
-                    name=name,
-                    qualified_name=name,
-                    file_path=file_path,
-                    line_start=line_start,
-                    line_end=line_end,
-                    language=language,
-                    source_code="\n".join(lines[line_start - 1:line_end]),
-                    parameters_count=param_count,
-                    is_public=not name.startswith("_"),
-                ))
+            params = match[f"{kind}_params"]
+            param_count = count_params(params)
+            
+            line_start = line_at(newlines, match.start())
+            # Estimate end by finding matching brace
+            line_end = min(line_start + 20, total_lines)
 
-        return functions
+            functions.append(FunctionMetrics(
+                name=name,
+                qualified_name=name,
+                file_path=file_path,
+                line_start=line_start,
+                line_end=line_end,
+                language=language,
+                source_code=line_span(source, newlines, line_start, line_end),
+                parameters_count=param_count,
+                is_public=not name.startswith("_"),
+            ))
 
-    def parse_imports(self, file_path: Path) -> list[str]:
-        source = safe_read(file_path)
-        if not source:
-            return []
+        return functions
 
+    def _parse_imports(self, source: str) -> list[str]:
         imports: list[str] = []
         for match in self.IMPORT_PATTERN.finditer(source):
             imp = match.group(1) or match.group(2)
@@ -5,86 +5,135 @@ from __future__ import annotations
 import ast
 from pathlib import Path
 
+from autotest.analyzer.complexity import calculate_complexity, calculate_complexity_for_tree
+from autotest.analyzer.parsers.base import (
+    ParseResult,
+    SourceParser,
+    line_span,
+    newline_offsets,
+)
 from autotest.models.analysis import FunctionMetrics
 from autotest.models.project import Language
-from autotest.utils.file_utils import safe_read
 
 
-class PythonParser:
-    """Parse Python files using the built-in ast module."""
+def _parse_ast(source: str) -> ast.Module | None:
+    """Parse source into an AST, returning None if it does not compile.
 
-    def parse_functions(self, file_path: Path) -> list[FunctionMetrics]:
-        """Extract all functions and methods from a Python file."""
-        source = safe_read(file_path)
-        if not source:
-            return []
+    Calls compile() directly with PyCF_ONLY_AST (what ast.parse does under
+    the hood) without inheriting the caller's future flags.
+    """
+    try:
+        return compile(source, "<source>", "exec", ast.PyCF_ONLY_AST, dont_inherit=True)
+    except (SyntaxError, ValueError):
+        return None
 
-        try:
-            tree = ast.parse(source)
-        except SyntaxError:
-            return []
 
-        functions: list[FunctionMetrics] = []
-        lines = source.splitlines()
-
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                # Determine qualified name
-                qualified = self._get_qualified_name(tree, node)
-
-                # Extract source code for this function
-                start = node.lineno - 1
-                end = node.end_lineno or node.lineno
-                func_source = chr(10).join(lines[start:end])
-
-                # Get docstring
-                docstring = ast.get_docstring(node)
-
-                # Check if public
-                is_public = not node.name.startswith("_")
-
-                functions.append(FunctionMetrics(
-                    name=node.name,
-                    qualified_name=qualified,
-                    file_path=file_path,
-                    line_start=node.lineno,
-                    line_end=end,
-                    language=Language.PYTHON,
-                    source_code=func_source,
-                    parameters_count=len(node.args.args),
-                    is_public=is_public,
-                    docstring=docstring,
-                ))
-
-        return functions
-
-    def parse_imports(self, file_path: Path) -> list[str]:
-        """Extract all imports from a Python file."""
-        source = safe_read(file_path)
-        if not source:
-            return []
+# Statement-list fields. Function/class definitions and imports are
+# statements, so traversals only need to follow these, never expressions.
+_BLOCK_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
 
-        try:
-            tree = ast.parse(source)
-        except SyntaxError:
-            return []
 
+def _iter_block_children(node: ast.AST):
+    for field in _BLOCK_FIELDS:
+        yield from getattr(node, field, ())
+
+
+class _Collector(ast.NodeVisitor):
+    """Single traversal that collects functions (with qualified names) and imports."""
+
+    def __init__(self, file_path: Path, source: str, tree: ast.Module) -> None:
+        self.file_path = file_path
+        self.source = source
+        self.newlines = newline_offsets(source)
+        self.complexity = calculate_complexity_for_tree(tree)
+        self.class_stack: list[str] = []
+        self.functions: list[FunctionMetrics] = []
+        self.imports: list[str] = []
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.class_stack.append(node.name)
+        self.generic_visit(node)
+        self.class_stack.pop()
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        # Qualified as OutermostClass.name, for anything nested under a class
+        qualified = f"{self.class_stack[0]}.{node.name}" if self.class_stack else node.name
+
+        # Extract source code for this function
+        end = node.end_lineno or node.lineno
+        func_source = line_span(self.source, self.newlines, node.lineno, end)
+
+        # Get docstring
+        docstring = ast.get_docstring(node)
+
+        # Check if public
+        is_public = not node.name.startswith("_")
+
+        func = FunctionMetrics(
+            name=node.name,
+            qualified_name=qualified,
+            file_path=self.file_path,
+            line_start=node.lineno,
+            line_end=end,
+            language=Language.PYTHON,
+            source_code=func_source,
+            parameters_count=len(node.args.args),
+            is_public=is_public,
+            docstring=docstring,
+        )
+        if node.lineno in self.complexity:
+            func.cyclomatic_complexity = self.complexity[node.lineno]
+        else:
+            func.cyclomatic_complexity = calculate_complexity(func)
+        self.functions.append(func)
+        self.generic_visit(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self.visit_FunctionDef(node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        for child in _iter_block_children(node):
+            self.visit(child)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            self.imports.append(alias.name)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.module:
+            self.imports.append(node.module)
+
+
+class PythonParser(SourceParser):
+    """Parse Python files using the built-in ast module."""
+
+    def parse(self, file_path: Path, source: str) -> ParseResult:
+        """Extract functions and imports from one parse and one traversal."""
+        tree = _parse_ast(source) if source else None
+        if tree is None:
+            return ParseResult([], [])
+        collector = _Collector(file_path, source, tree)
+        collector.visit(tree)
+        return ParseResult(collector.functions, collector.imports)
+
+    def _parse_functions(self, file_path: Path, source: str) -> list[FunctionMetrics]:
+        """Extract all functions and methods from Python source."""
+        return self.parse(file_path, source).functions
+
+    def _parse_imports(self, source: str) -> list[str]:
+        """Extract all imports from Python source (no function collection)."""
+        tree = _parse_ast(source)
+        if tree is None:
+            return []
         imports: list[str] = []
-        for node in ast.walk(tree):
+        stack: list[ast.AST] = [tree]
+        while stack:
+            node = stack.pop()
+            stack.extend(_iter_block_children(node))
             if isinstance(node, ast.Import):
                 for alias in node.names:
                     imports.append(alias.name)
             elif isinstance(node, ast.ImportFrom):
                 if node.module:
                     imports.append(node.module)
-
         return imports
-
-    def _get_qualified_name(self, tree: ast.Module, target: ast.AST) -> str:
-        """Get the fully qualified name of a function (module.Class.method)."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                for item in ast.walk(node):
-                    if item is target:
-                        return f"{node.name}.{target.name}"
-        return target.name
@@ -4,15 +4,15 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from autotest import __version__
-from autotest.config import load_config
+
+if TYPE_CHECKING:
+    from autotest.config import AutoTestConfig
 
 app = typer.Typer(
     name="autotest",
@@ -61,8 +61,9 @@ def diagnose(
         console.print(f"[red]Error:[/red] La ruta '{target}' no existe.")
         raise typer.Exit(1)
 
-    output_dir = target / "reports"
+    from autotest.config import load_config
 
+    output_dir = target / "reports"
     cfg = load_config(
         target_path=target,
         config_file=config,
@@ -80,42 +81,7 @@ def diagnose(
     raise typer.Exit(exit_code)
 
 
-@app.command()
-def scan(
-    path: Path = typer.Argument(Path("."), help="Ruta al proyecto a analizar."),
-    config: Optional[Path] = typer.Option(None, "--config", "-c", help="Archivo de configuracion."),
-    output: str = typer.Option("terminal,html", "--output", "-o", help="Formatos de salida: terminal,json,html,markdown"),
-    severity: str = typer.Option("critical,warning", "--severity", "-s", help="Severidades a mostrar."),
-    top: int = typer.Option(5, "--top", "-t", help="Numero maximo de findings por grupo de severidad."),
-    no_ai: bool = typer.Option(False, "--no-ai", help="Desactivar revision con IA."),
-    verbose: bool = typer.Option(False, "--verbose", help="Salida detallada."),
-    open_report: bool = typer.Option(False, "--open", help="Abrir reporte HTML en navegador."),
-    fix: bool = typer.Option(False, "--fix", help="Aplicar fixes automaticamente al codigo fuente."),
-    dry_run: bool = typer.Option(False, "--dry-run", help="Mostrar que fixes se aplicarian sin modificar archivos."),
-) -> None:
-    """Ejecutar diagnostico completo (alias de diagnose)."""
-    target = path.resolve()
-    if not target.exists():
-        console.print(f"[red]Error:[/red] La ruta '{target}' no existe.")
-        raise typer.Exit(1)
-
-    output_dir = target / "reports"
-
-    cfg = load_config(
-        target_path=target,
-        config_file=config,
-        output_formats=output.split(","),
-        ai_enabled=not no_ai,
-        verbose=verbose,
-        output_dir=output_dir,
-        severity_filter=severity.split(","),
-        top_findings=top,
-    )
-
-    exit_code = asyncio.run(_run_diagnosis(
-        cfg, open_report=open_report, apply_fix=fix, dry_run=dry_run
-    ))
-    raise typer.Exit(exit_code)
+app.command("scan", help="Ejecutar diagnostico completo (alias de diagnose).")(diagnose)
 
 
 @app.command()
@@ -129,6 +95,8 @@ def detect(
         console.print(f"[red]Error:[/red] La ruta '{target}' no existe.")
         raise typer.Exit(1)
 
+    from autotest.config import load_config
+
     cfg = load_config(target_path=target, verbose=verbose)
     asyncio.run(_run_detect(cfg))
 
@@ -144,6 +112,8 @@ def analyze(
         console.print(f"[red]Error:[/red] La ruta '{target}' no existe.")
         raise typer.Exit(1)
 
+    from autotest.config import load_config
+
     cfg = load_config(target_path=target, verbose=verbose)
     asyncio.run(_run_analyze(cfg))
 
@@ -163,6 +133,10 @@ async def _run_diagnosis(
         Exit code: 0 = healthy, 1 = critical findings found.
     """
     import webbrowser
+
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     from autotest.detector.scanner import ProjectScanner
     from autotest.analyzer.engine import AnalysisEngine
     from autotest.diagnosis.engine import DiagnosisEngine
@@ -178,6 +152,8 @@ async def _run_diagnosis(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
+        refresh_per_second=4,
+        disable=not console.is_terminal,  # no spinner redraws when output is captured
     ) as progress:
         # Phase 1: Detect
         task = progress.add_task("Detectando tecnologias...", total=None)
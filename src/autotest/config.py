@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import os
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-import yaml
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
 
 from autotest.constants import (
+    DEFAULT_AI_BATCH_THRESHOLD,
+    DEFAULT_AI_BATCH_TIMEOUT_SECONDS,
     DEFAULT_AI_MAX_FUNCTIONS,
     DEFAULT_MIN_FINDING_CONFIDENCE,
     DEFAULT_OUTPUT_FORMATS,
@@ -46,6 +50,9 @@ class AutoTestConfig(BaseSettings):
     ai_model: str = "claude-sonnet-4-20250514"
     ai_max_functions: int = DEFAULT_AI_MAX_FUNCTIONS
     ai_max_cost_usd: float = 5.0
+    ai_use_batch: bool = False
+    ai_batch_threshold: int = DEFAULT_AI_BATCH_THRESHOLD
+    ai_batch_timeout_seconds: float = DEFAULT_AI_BATCH_TIMEOUT_SECONDS
 
     # Diagnosis configuration
     min_finding_confidence: float = DEFAULT_MIN_FINDING_CONFIDENCE
@@ -57,6 +64,8 @@ class AutoTestConfig(BaseSettings):
     # Analysis thresholds
     complexity_threshold: int = 10
     coupling_threshold: int = 8
+    analysis_workers: int | None = None  # None = one per CPU
+    analysis_cache: bool = True
 
     # Logging
     verbose: bool = False
@@ -75,27 +84,50 @@ def load_config(
 
     # Try .autotest.yaml first
     if config_file and config_file.exists():
-        file_config = _load_yaml(config_file)
+        file_config = _load_config_file(config_file, _load_yaml)
     elif target_path:
         yaml_path = target_path / ".autotest.yaml"
         if yaml_path.exists():
-            file_config = _load_yaml(yaml_path)
+            file_config = _load_config_file(yaml_path, _load_yaml)
         else:
             # Try pyproject.toml [tool.autotest]
             pyproject = target_path / "pyproject.toml"
             if pyproject.exists():
-                file_config = _load_pyproject(pyproject)
+                file_config = _load_config_file(pyproject, _load_pyproject)
 
     # Merge: file config + overrides
-    merged = {**file_config, **{k: v for k, v in overrides.items() if v is not None}}
+    merged = file_config | {k: v for k, v in overrides.items() if v is not None}
     if target_path is not None:
         merged["target_path"] = target_path
 
     return AutoTestConfig(**merged)
 
 
+def _load_config_file(path: Path, loader: Callable[[Path], dict[str, Any]]) -> dict[str, Any]:
+    """Parse a config file, reusing the last parse while the file is unchanged.
+
+    The model itself is not cached: env vars and overrides can differ per
+    call, and callers mutate the returned config.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return {}
+    data = _parse_config_file(path, loader, stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(data)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_file(
+    path: Path, loader: Callable[[Path], dict[str, Any]], mtime_ns: int, size: int
+) -> dict[str, Any]:
+    return loader(path)
+
+
 def _load_yaml(path: Path) -> dict[str, Any]:
     """Load configuration from a YAML file."""
+    import yaml
+
     with open(path) as f:
         data = yaml.safe_load(f)
     return data if isinstance(data, dict) else {}
@@ -103,13 +135,12 @@ def _load_yaml(path: Path) -> dict[str, Any]:
 
 def _load_pyproject(path: Path) -> dict[str, Any]:
     """Load [tool.autotest] section from pyproject.toml."""
-    try:
-        if hasattr(path, "read_text"):
-            import tomllib
+    import tomllib
 
-            with open(path, "rb") as f:
-                data = tomllib.load(f)
-            return data.get("tool", {}).get("autotest", {})
-    except Exception:
+    try:
+        data = tomllib.loads(path.read_bytes().decode("utf-8"))
+    except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError):
         return {}
-    return {}
+    tool = data.get("tool", {})
+    section = tool.get("autotest", {}) if isinstance(tool, dict) else {}
+    return section if isinstance(section, dict) else {}
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from autotest.models.project import Language
 
+# Lookup tables below are read-only MappingProxyType views, safe to share
+# across threads. The views themselves are unhashable; their tuple values can
+# be passed to cached functions as keys.
+
 # File extensions to language mapping
-EXTENSION_MAP: dict[str, Language] = {
+EXTENSION_MAP: Mapping[str, Language] = MappingProxyType({
     ".py": Language.PYTHON,
     ".pyw": Language.PYTHON,
     ".js": Language.JAVASCRIPT,
@@ -18,7 +25,7 @@ EXTENSION_MAP: dict[str, Language] = {
     ".go": Language.GO,
     ".rs": Language.RUST,
     ".cs": Language.CSHARP,
-}
+})
 
 # Directories to skip during scanning
 SKIP_DIRS: set[str] = {
@@ -48,52 +55,52 @@ SKIP_DIRS: set[str] = {
 }
 
 # Build/config files per language
-BUILD_FILES: dict[Language, list[str]] = {
-    Language.PYTHON: [
+BUILD_FILES: Mapping[Language, tuple[str, ...]] = MappingProxyType({
+    Language.PYTHON: (
         "pyproject.toml",
         "setup.py",
         "setup.cfg",
         "requirements.txt",
         "Pipfile",
         "poetry.lock",
-    ],
-    Language.JAVASCRIPT: [
+    ),
+    Language.JAVASCRIPT: (
         "package.json",
         "package-lock.json",
         "yarn.lock",
         "pnpm-lock.yaml",
         "bun.lockb",
-    ],
-    Language.TYPESCRIPT: [
+    ),
+    Language.TYPESCRIPT: (
         "tsconfig.json",
         "package.json",
-    ],
-    Language.JAVA: [
+    ),
+    Language.JAVA: (
         "pom.xml",
         "build.gradle",
         "build.gradle.kts",
         "settings.gradle",
         "settings.gradle.kts",
-    ],
-    Language.GO: [
+    ),
+    Language.GO: (
         "go.mod",
         "go.sum",
-    ],
-    Language.RUST: [
+    ),
+    Language.RUST: (
         "Cargo.toml",
         "Cargo.lock",
-    ],
-    Language.CSHARP: [
+    ),
+    Language.CSHARP: (
         "*.csproj",
         "*.sln",
         "Directory.Build.props",
-    ],
-}
+    ),
+})
 
 # Test file patterns per language
-TEST_PATTERNS: dict[Language, list[str]] = {
-    Language.PYTHON: ["test_*.py", "*_test.py", "tests/**/*.py", "test/**/*.py"],
-    Language.JAVASCRIPT: [
+TEST_PATTERNS: Mapping[Language, tuple[str, ...]] = MappingProxyType({
+    Language.PYTHON: ("test_*.py", "*_test.py", "tests/**/*.py", "test/**/*.py"),
+    Language.JAVASCRIPT: (
         "*.test.js",
         "*.spec.js",
         "*.test.ts",
@@ -103,19 +110,19 @@ TEST_PATTERNS: dict[Language, list[str]] = {
         "*.test.tsx",
         "*.spec.tsx",
         "__tests__/**/*",
-    ],
-    Language.TYPESCRIPT: [
+    ),
+    Language.TYPESCRIPT: (
         "*.test.ts",
         "*.spec.ts",
         "*.test.tsx",
         "*.spec.tsx",
         "__tests__/**/*",
-    ],
-    Language.JAVA: ["*Test.java", "*Tests.java", "*Spec.java", "Test*.java"],
-    Language.GO: ["*_test.go"],
-    Language.RUST: [],  # Rust tests are inline, detected differently
-    Language.CSHARP: ["*Test.cs", "*Tests.cs", "*.Tests/**/*.cs"],
-}
+    ),
+    Language.JAVA: ("*Test.java", "*Tests.java", "*Spec.java", "Test*.java"),
+    Language.GO: ("*_test.go",),
+    Language.RUST: (),  # Rust tests are inline, detected differently
+    Language.CSHARP: ("*Test.cs", "*Tests.cs", "*.Tests/**/*.cs"),
+})
 
 # Complexity thresholds
 COMPLEXITY_LOW = 5
@@ -123,6 +130,9 @@ COMPLEXITY_MEDIUM = 10
 COMPLEXITY_HIGH = 20
 COMPLEXITY_VERY_HIGH = 50
 
+# Analysis: projects with at least this many source files are parsed in a process pool
+PARALLEL_ANALYSIS_MIN_FILES = 64
+
 # Default output formats
 DEFAULT_OUTPUT_FORMATS = ["terminal"]
 
@@ -131,6 +141,11 @@ DEFAULT_AI_MODEL = "claude-sonnet-4-20250514"
 
 # Diagnosis defaults
 DEFAULT_AI_MAX_FUNCTIONS = 10
+DEFAULT_AI_BATCH_THRESHOLD = 10
+AI_BATCH_POLL_SECONDS = 10.0
+DEFAULT_AI_BATCH_TIMEOUT_SECONDS = 3600.0
+MAX_CONCURRENT_AI_REQUESTS = 3
+MAX_CONCURRENT_AI_REQUESTS_CEILING = 8
 DEFAULT_MIN_FINDING_CONFIDENCE = 0.6
 DEFAULT_SEVERITY_FILTER = ["critical", "warning"]
 DEFAULT_TOP_FINDINGS = 5
@@ -3,14 +3,34 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from pathlib import Path
 
 from autotest.models.project import FrameworkInfo, LanguageInfo
+from autotest.utils import file_utils
 
 
 class BaseLanguageDetector(ABC):
     """Abstract base class for language detectors."""
 
+    _file_index: file_utils.FileIndex | None = None
+
+    def use_file_index(self, index: file_utils.FileIndex) -> None:
+        """Serve file lookups under index.root from an existing walk."""
+        self._file_index = index
+
+    def collect_files(self, root: Path, extensions: set[str]) -> list[Path]:
+        """Source files under root with the given extensions."""
+        if self._file_index is not None and self._file_index.root == root:
+            return self._file_index.collect_files(extensions)
+        return file_utils.collect_files(root, extensions)
+
+    def find_files_by_pattern(self, root: Path, patterns: Sequence[str]) -> list[Path]:
+        """Files under root matching rglob-style patterns."""
+        if self._file_index is not None and self._file_index.root == root:
+            return self._file_index.find_files_by_pattern(patterns)
+        return file_utils.find_files_by_pattern(root, patterns)
+
     @property
     @abstractmethod
     def language_name(self) -> str:
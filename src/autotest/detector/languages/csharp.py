@@ -7,38 +7,41 @@ from pathlib import Path
 from autotest.detector.base import BaseLanguageDetector
 from autotest.detector.registry import register
 from autotest.models.project import FrameworkInfo, Language, LanguageInfo
-from autotest.utils.file_utils import collect_files, count_lines, find_files_by_pattern, safe_read
+from autotest.utils.file_utils import safe_read_lower, total_lines
 
 
 @register("csharp")
 class CSharpDetector(BaseLanguageDetector):
 
+    def __init__(self) -> None:
+        self._csprojs: dict[Path, list[Path]] = {}
+
     @property
     def language_name(self) -> str:
         return "csharp"
 
     def detect(self, root: Path) -> LanguageInfo | None:
-        files = collect_files(root, {".cs"})
+        files = self.collect_files(root, {".cs"})
         if not files:
             return None
 
-        test_files = find_files_by_pattern(root, [
+        test_files = self.find_files_by_pattern(root, [
             "*Test.cs", "*Tests.cs", "*.Tests/**/*.cs",
         ])
 
         return LanguageInfo(
             language=Language.CSHARP,
             files=files,
-            total_loc=sum(count_lines(f) for f in files),
+            total_loc=total_lines(files),
             existing_test_files=test_files,
-            build_tool="dotnet" if list(root.rglob("*.csproj")) or list(root.rglob("*.sln")) else None,
+            build_tool="dotnet" if self._find_csprojs(root) or any(root.rglob("*.sln")) else None,
         )
 
     def detect_frameworks(self, root: Path) -> list[FrameworkInfo]:
         frameworks: list[FrameworkInfo] = []
         
-        for csproj in root.rglob("*.csproj"):
-            content = safe_read(csproj).lower()
+        for csproj in self._find_csprojs(root):
+            content = safe_read_lower(csproj)
             if "microsoft.aspnetcore" in content:
                 frameworks.append(FrameworkInfo(name="ASP.NET Core", config_file=csproj))
             if "microsoft.entityframeworkcore" in content:
@@ -53,8 +56,8 @@ class CSharpDetector(BaseLanguageDetector):
     def detect_test_tools(self, root: Path) -> list[str]:
         tools: list[str] = []
         
-        for csproj in root.rglob("*.csproj"):
-            content = safe_read(csproj).lower()
+        for csproj in self._find_csprojs(root):
+            content = safe_read_lower(csproj)
             if "xunit" in content:
                 tools.append("xunit")
             if "nunit" in content:
@@ -69,3 +72,9 @@ class CSharpDetector(BaseLanguageDetector):
                 tools.append("fluentassertions")
 
         return list(set(tools))
+
+    def _find_csprojs(self, root: Path) -> list[Path]:
+        """Project files under root, walked once per scan and shared by all passes."""
+        if root not in self._csprojs:
+            self._csprojs[root] = list(root.rglob("*.csproj"))
+        return self._csprojs[root]
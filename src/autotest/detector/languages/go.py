@@ -7,7 +7,7 @@ from pathlib import Path
 from autotest.detector.base import BaseLanguageDetector
 from autotest.detector.registry import register
 from autotest.models.project import FrameworkInfo, Language, LanguageInfo
-from autotest.utils.file_utils import collect_files, count_lines, find_files_by_pattern, safe_read
+from autotest.utils.file_utils import safe_read_lower, total_lines
 
 
 @register("go")
@@ -18,17 +18,17 @@ class GoDetector(BaseLanguageDetector):
         return "go"
 
     def detect(self, root: Path) -> LanguageInfo | None:
-        files = collect_files(root, {".go"})
+        files = self.collect_files(root, {".go"})
         if not files:
             return None
 
-        test_files = find_files_by_pattern(root, ["*_test.go"])
+        test_files = self.find_files_by_pattern(root, ["*_test.go"])
         source_files = [f for f in files if not f.name.endswith("_test.go")]
 
         return LanguageInfo(
             language=Language.GO,
             files=source_files,
-            total_loc=sum(count_lines(f) for f in source_files),
+            total_loc=total_lines(source_files),
             existing_test_files=test_files,
             build_tool="go" if (root / "go.mod").exists() else None,
         )
@@ -39,7 +39,7 @@ class GoDetector(BaseLanguageDetector):
         if not gomod.exists():
             return frameworks
 
-        content = safe_read(gomod).lower()
+        content = safe_read_lower(gomod)
         framework_map = {
             "gin-gonic/gin": "Gin",
             "gorilla/mux": "Gorilla Mux",
@@ -59,7 +59,7 @@ class GoDetector(BaseLanguageDetector):
         tools: list[str] = ["go test"]  # Built-in
         gomod = root / "go.mod"
         if gomod.exists():
-            content = safe_read(gomod).lower()
+            content = safe_read_lower(gomod)
             if "testify" in content:
                 tools.append("testify")
             if "gomock" in content:
@@ -7,7 +7,7 @@ from pathlib import Path
 from autotest.detector.base import BaseLanguageDetector
 from autotest.detector.registry import register
 from autotest.models.project import FrameworkInfo, Language, LanguageInfo
-from autotest.utils.file_utils import collect_files, count_lines, find_files_by_pattern, safe_read
+from autotest.utils.file_utils import safe_read_lower, total_lines
 
 
 @register("java")
@@ -18,18 +18,18 @@ class JavaDetector(BaseLanguageDetector):
         return "java"
 
     def detect(self, root: Path) -> LanguageInfo | None:
-        files = collect_files(root, {".java"})
+        files = self.collect_files(root, {".java"})
         if not files:
             return None
 
-        test_files = find_files_by_pattern(root, [
+        test_files = self.find_files_by_pattern(root, [
             "*Test.java", "*Tests.java", "*Spec.java", "Test*.java",
         ])
 
         return LanguageInfo(
             language=Language.JAVA,
             files=files,
-            total_loc=sum(count_lines(f) for f in files),
+            total_loc=total_lines(files),
             existing_test_files=test_files,
             build_tool=self._detect_build_tool(root),
         )
@@ -40,7 +40,7 @@ class JavaDetector(BaseLanguageDetector):
         # Check pom.xml
         pom = root / "pom.xml"
         if pom.exists():
-            content = safe_read(pom).lower()
+            content = safe_read_lower(pom)
             if "spring-boot" in content:
                 frameworks.append(FrameworkInfo(name="Spring Boot", config_file=pom))
             elif "spring" in content:
@@ -56,7 +56,7 @@ class JavaDetector(BaseLanguageDetector):
         for gradle in ["build.gradle", "build.gradle.kts"]:
             gf = root / gradle
             if gf.exists():
-                content = safe_read(gf).lower()
+                content = safe_read_lower(gf)
                 if "spring" in content:
                     frameworks.append(FrameworkInfo(name="Spring Boot", config_file=gf))
 
@@ -68,7 +68,7 @@ class JavaDetector(BaseLanguageDetector):
         for config_file in ["pom.xml", "build.gradle", "build.gradle.kts"]:
             path = root / config_file
             if path.exists():
-                content = safe_read(path).lower()
+                content = safe_read_lower(path)
                 if "junit" in content:
                     tools.append("junit")
                 if "mockito" in content:
@@ -8,35 +8,61 @@ from pathlib import Path
 from autotest.detector.base import BaseLanguageDetector
 from autotest.detector.registry import register
 from autotest.models.project import FrameworkInfo, Language, LanguageInfo
-from autotest.utils.file_utils import collect_files, count_lines, find_files_by_pattern, safe_read
+from autotest.utils.file_utils import safe_read, total_lines
+
+# package.json dependency key -> framework display name
+_FRAMEWORKS: dict[str, str] = {
+    "react": "React",
+    "react-dom": "React",
+    "vue": "Vue.js",
+    "nuxt": "Nuxt",
+    "@angular/core": "Angular",
+    "svelte": "Svelte",
+    "next": "Next.js",
+    "express": "Express",
+    "fastify": "Fastify",
+    "koa": "Koa",
+    "nestjs": "NestJS",
+    "@nestjs/core": "NestJS",
+    "hapi": "Hapi",
+    "gatsby": "Gatsby",
+    "remix": "Remix",
+    "electron": "Electron",
+}
+_FRAMEWORK_KEYS = frozenset(_FRAMEWORKS)
 
 
 @register("javascript")
 class JavaScriptDetector(BaseLanguageDetector):
     """Detects JavaScript/TypeScript projects."""
 
+    def __init__(self) -> None:
+        self._deps: dict[Path, dict | None] = {}
+
     @property
     def language_name(self) -> str:
         return "javascript"
 
     def detect(self, root: Path) -> LanguageInfo | None:
-        js_files = collect_files(root, {".js", ".jsx", ".mjs", ".cjs"})
-        ts_files = collect_files(root, {".ts", ".tsx"})
+        js_files = self.collect_files(root, {".js", ".jsx", ".mjs", ".cjs"})
+        ts_files = self.collect_files(root, {".ts", ".tsx"})
         all_files = js_files + ts_files
         
         if not all_files:
             return None
 
-        test_files = find_files_by_pattern(root, [
+        test_files = self.find_files_by_pattern(root, [
             "*.test.js", "*.spec.js", "*.test.ts", "*.spec.ts",
             "*.test.jsx", "*.spec.jsx", "*.test.tsx", "*.spec.tsx",
         ])
         # Also check __tests__ directories
-        test_files.extend(find_files_by_pattern(root, ["__tests__/**/*.js", "__tests__/**/*.ts"]))
+        test_files.extend(self.find_files_by_pattern(root, [
+            "__tests__/**/*.js", "__tests__/**/*.ts",
+        ]))
 
         # Use TypeScript as language if TS files dominate
-        ts_loc = sum(count_lines(f) for f in ts_files)
-        js_loc = sum(count_lines(f) for f in js_files)
+        ts_loc = total_lines(ts_files)
+        js_loc = total_lines(js_files)
         language = Language.TYPESCRIPT if ts_loc > js_loc else Language.JAVASCRIPT
 
         return LanguageInfo(
@@ -49,34 +75,14 @@ class JavaScriptDetector(BaseLanguageDetector):
 
     def detect_frameworks(self, root: Path) -> list[FrameworkInfo]:
         frameworks: list[FrameworkInfo] = []
-        pkg = self._load_package_json(root)
-        if not pkg:
+        all_deps = self._load_dependencies(root)
+        if all_deps is None:
             return frameworks
 
-        all_deps = {**pkg.get("dependencies", {}), **pkg.get("devDependencies", {})}
-        
-        framework_map = {
-            "react": "React",
-            "react-dom": "React",
-            "vue": "Vue.js",
-            "nuxt": "Nuxt",
-            "@angular/core": "Angular",
-            "svelte": "Svelte",
-            "next": "Next.js",
-            "express": "Express",
-            "fastify": "Fastify",
-            "koa": "Koa",
-            "nestjs": "NestJS",
-            "@nestjs/core": "NestJS",
-            "hapi": "Hapi",
-            "gatsby": "Gatsby",
-            "remix": "Remix",
-            "electron": "Electron",
-        }
-
+        matched = _FRAMEWORK_KEYS & all_deps.keys()
         seen = set()
-        for dep_key, display_name in framework_map.items():
-            if dep_key in all_deps and display_name not in seen:
+        for dep_key, display_name in _FRAMEWORKS.items():
+            if dep_key in matched and display_name not in seen:
                 seen.add(display_name)
                 frameworks.append(FrameworkInfo(
                     name=display_name,
@@ -88,12 +94,10 @@ class JavaScriptDetector(BaseLanguageDetector):
 
     def detect_test_tools(self, root: Path) -> list[str]:
         tools: list[str] = []
-        pkg = self._load_package_json(root)
-        if not pkg:
+        all_deps = self._load_dependencies(root)
+        if all_deps is None:
             return tools
 
-        all_deps = {**pkg.get("dependencies", {}), **pkg.get("devDependencies", {})}
-        
         if "jest" in all_deps:
             tools.append("jest")
         if "vitest" in all_deps:
@@ -108,7 +112,9 @@ class JavaScriptDetector(BaseLanguageDetector):
             tools.append("c8")
         if "istanbul" in all_deps or "nyc" in all_deps:
             tools.append("istanbul")
-        if "testing-library" in str(all_deps):
+        if any(
+            key == "testing-library" or key.startswith("@testing-library/") for key in all_deps
+        ):
             tools.append("testing-library")
 
         return tools
@@ -126,11 +132,22 @@ class JavaScriptDetector(BaseLanguageDetector):
             return "npm"
         return None
 
+    def _load_dependencies(self, root: Path) -> dict | None:
+        """Merged dependencies + devDependencies, parsed once per scan root."""
+        if root not in self._deps:
+            pkg = self._load_package_json(root)
+            self._deps[root] = (
+                {**pkg.get("dependencies", {}), **pkg.get("devDependencies", {})}
+                if pkg else None
+            )
+        return self._deps[root]
+
     def _load_package_json(self, root: Path) -> dict | None:
         pkg_path = root / "package.json"
         if not pkg_path.exists():
             return None
         try:
-            return json.loads(safe_read(pkg_path))
-        except (json.JSONDecodeError, Exception):
+            pkg = json.loads(safe_read(pkg_path))
+        except ValueError:  # includes json.JSONDecodeError
             return None
+        return pkg if isinstance(pkg, dict) else None
@@ -2,34 +2,42 @@
 
 from __future__ import annotations
 
+import re
+import tomllib
 from pathlib import Path
 
 from autotest.constants import TEST_PATTERNS
 from autotest.detector.base import BaseLanguageDetector
 from autotest.detector.registry import register
 from autotest.models.project import FrameworkInfo, Language, LanguageInfo
-from autotest.utils.file_utils import collect_files, count_lines, find_files_by_pattern, safe_read
+from autotest.utils.file_utils import safe_read, safe_read_lower, total_lines
+
+# Distribution name at the start of a PEP 508 requirement ("Django[argon2]>=4" -> "Django")
+_REQUIREMENT_NAME_RE = re.compile(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
 
 
 @register("python")
 class PythonDetector(BaseLanguageDetector):
     """Detects Python projects and their characteristics."""
 
+    def __init__(self) -> None:
+        self._deps: dict[Path, set[str]] = {}
+
     @property
     def language_name(self) -> str:
         return "python"
 
     def detect(self, root: Path) -> LanguageInfo | None:
-        files = collect_files(root, {".py", ".pyw"})
+        files = self.collect_files(root, {".py", ".pyw"})
         if not files:
             return None
 
         # Find test files using centralized patterns
-        test_files = find_files_by_pattern(root, TEST_PATTERNS[Language.PYTHON])
+        test_files = self.find_files_by_pattern(root, TEST_PATTERNS[Language.PYTHON])
 
         # Determine build tool
         build_tool = self._detect_build_tool(root)
-        total_loc = sum(count_lines(f) for f in files)
+        total_loc = total_lines(files)
 
         return LanguageInfo(
             language=Language.PYTHON,
@@ -127,6 +135,12 @@ class PythonDetector(BaseLanguageDetector):
         return None
 
     def _gather_dependencies(self, root: Path) -> set[str]:
+        """Declared dependency names (lowercase), gathered once per scan root."""
+        if root not in self._deps:
+            self._deps[root] = self._read_dependencies(root)
+        return self._deps[root]
+
+    def _read_dependencies(self, root: Path) -> set[str]:
         deps: set[str] = set()
         
         # From requirements.txt
@@ -138,28 +152,15 @@ class PythonDetector(BaseLanguageDetector):
                     name = line.split("==")[0].split(">=")[0].split("<=")[0].split("[")[0].strip()
                     deps.add(name.lower())
 
-        # From pyproject.toml dependencies
+        # From pyproject.toml: PEP 621 (incl. optional groups) and Poetry tables
         pp = root / "pyproject.toml"
         if pp.exists():
-            content = safe_read(pp).lower()
-            # Simple extraction from dependencies list
-            in_deps = False
-            for line in content.splitlines():
-                if "dependencies" in line and "=" in line:
-                    in_deps = True
-                    continue
-                if in_deps:
-                    if line.strip().startswith("]"):
-                        in_deps = False
-                        continue
-                    if '"' in line:
-                        pkg = line.strip().strip('",').split(">=")[0].split("==")[0].split("<")[0].strip()
-                        deps.add(pkg.lower())
+            deps.update(_pyproject_dependencies(safe_read(pp)))
 
         # From setup.py (basic extraction)
         sp = root / "setup.py"
         if sp.exists():
-            content = safe_read(sp).lower()
+            content = safe_read_lower(sp)
             if "install_requires" in content:
                 # Basic regex-free extraction
                 for word in ["django", "flask", "fastapi", "pytest", "numpy", "pandas"]:
@@ -167,3 +168,46 @@ class PythonDetector(BaseLanguageDetector):
                         deps.add(word)
 
         return deps
+
+
+def _pyproject_dependencies(content: str) -> set[str]:
+    """Dependency names declared in a pyproject.toml, lowercased."""
+    try:
+        data = tomllib.loads(content)
+    except tomllib.TOMLDecodeError:
+        return set()
+
+    # Any table or array of the wrong type is skipped, never raised on.
+    requirements: list[object] = []
+    project = _table(data, "project")
+    requirements.extend(_array(project, "dependencies"))
+    for group in _table(project, "optional-dependencies").values():
+        if isinstance(group, list):
+            requirements.extend(group)
+
+    names: set[str] = set()
+    for requirement in requirements:
+        if isinstance(requirement, str) and (match := _REQUIREMENT_NAME_RE.match(requirement)):
+            names.add(match.group(1).lower())
+
+    poetry = _table(_table(data, "tool"), "poetry")
+    tables = [_table(poetry, "dependencies"), _table(poetry, "dev-dependencies")]
+    tables.extend(
+        _table(group, "dependencies")
+        for group in _table(poetry, "group").values()
+        if isinstance(group, dict)
+    )
+    for table in tables:
+        names.update(name.lower() for name in table if name.lower() != "python")
+
+    return names
+
+
+def _table(data: dict, key: str) -> dict:
+    value = data.get(key, {})
+    return value if isinstance(value, dict) else {}
+
+
+def _array(data: dict, key: str) -> list:
+    value = data.get(key, [])
+    return value if isinstance(value, list) else []
@@ -7,7 +7,7 @@ from pathlib import Path
 from autotest.detector.base import BaseLanguageDetector
 from autotest.detector.registry import register
 from autotest.models.project import FrameworkInfo, Language, LanguageInfo
-from autotest.utils.file_utils import collect_files, count_lines, safe_read
+from autotest.utils.file_utils import safe_read_lower, total_lines
 
 
 @register("rust")
@@ -18,7 +18,7 @@ class RustDetector(BaseLanguageDetector):
         return "rust"
 
     def detect(self, root: Path) -> LanguageInfo | None:
-        files = collect_files(root, {".rs"})
+        files = self.collect_files(root, {".rs"})
         if not files:
             return None
 
@@ -28,7 +28,7 @@ class RustDetector(BaseLanguageDetector):
         return LanguageInfo(
             language=Language.RUST,
             files=files,
-            total_loc=sum(count_lines(f) for f in files),
+            total_loc=total_lines(files),
             existing_test_files=test_files,
             build_tool="cargo" if (root / "Cargo.toml").exists() else None,
         )
@@ -39,7 +39,7 @@ class RustDetector(BaseLanguageDetector):
         if not cargo.exists():
             return frameworks
 
-        content = safe_read(cargo).lower()
+        content = safe_read_lower(cargo)
         framework_map = {
             "actix-web": "Actix Web",
             "rocket": "Rocket",
@@ -60,7 +60,7 @@ class RustDetector(BaseLanguageDetector):
         tools: list[str] = ["cargo test"]  # Built-in
         cargo = root / "Cargo.toml"
         if cargo.exists():
-            content = safe_read(cargo).lower()
+            content = safe_read_lower(cargo)
             if "mockall" in content:
                 tools.append("mockall")
             if "proptest" in content:
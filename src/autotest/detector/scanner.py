@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 from autotest.config import AutoTestConfig
-from autotest.models.project import ProjectInfo
+from autotest.detector.base import BaseLanguageDetector
+from autotest.models.project import LanguageInfo, ProjectInfo
+from autotest.utils.file_utils import FileIndex
 from autotest.utils.git_utils import get_current_branch, is_git_repo
 
 # Import language detectors to trigger registration
@@ -29,12 +32,15 @@ class ProjectScanner:
         total_loc = 0
         total_files = 0
 
-        for _name, detector_cls in detectors.items():
-            detector = detector_cls()
-            lang_info = detector.detect(root)
-            if lang_info is not None and lang_info.files:
-                lang_info.frameworks = detector.detect_frameworks(root)
-                lang_info.existing_test_tools = detector.detect_test_tools(root)
+        # Walk the tree once for every detector, then run them side by side
+        # in threads since they only block on disk I/O.
+        index = await asyncio.to_thread(FileIndex, root)
+        results = await asyncio.gather(*(
+            asyncio.to_thread(_detect_language, detector_cls(), index)
+            for detector_cls in detectors.values()
+        ))
+        for lang_info in results:
+            if lang_info is not None:
                 languages.append(lang_info)
                 total_loc += lang_info.total_loc
                 total_files += len(lang_info.files)
@@ -63,3 +69,15 @@ class ProjectScanner:
             total_loc=total_loc,
             config_files_found=config_files,
         )
+
+
+def _detect_language(detector: BaseLanguageDetector, index: FileIndex) -> LanguageInfo | None:
+    """Run one detector's passes; None if its language is not present."""
+    root = index.root
+    detector.use_file_index(index)
+    lang_info = detector.detect(root)
+    if lang_info is None or not lang_info.files:
+        return None
+    lang_info.frameworks = detector.detect_frameworks(root)
+    lang_info.existing_test_tools = detector.detect_test_tools(root)
+    return lang_info
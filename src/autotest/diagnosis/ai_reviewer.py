@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import json
 import logging
+from itertools import chain
 from typing import Any
 
+try:
+    import anthropic
+except ImportError:
+    anthropic = None
+
 from autotest.config import AutoTestConfig
+from autotest.constants import (
+    AI_BATCH_POLL_SECONDS,
+    MAX_CONCURRENT_AI_REQUESTS,
+    MAX_CONCURRENT_AI_REQUESTS_CEILING,
+)
 from autotest.exceptions import AIReviewError
 from autotest.models.analysis import AnalysisReport, FunctionMetrics, ModuleMetrics
 from autotest.models.diagnosis import (
@@ -22,6 +34,7 @@ from autotest.diagnosis.prompts import (
     REVIEW_SYSTEM_PROMPT,
     build_review_prompt,
 )
+from autotest.utils.async_helpers import AdmissionController
 
 logger = logging.getLogger(__name__)
 
@@ -46,8 +59,29 @@ class AICodeReviewer:
 
     def __init__(self, config: AutoTestConfig) -> None:
         self.config = config
-        self._semaphore = asyncio.Semaphore(3)
+        # Start conservatively and let sustained successes raise the limit
+        self._admission = AdmissionController(
+            MAX_CONCURRENT_AI_REQUESTS, max_limit=MAX_CONCURRENT_AI_REQUESTS_CEILING
+        )
         self._total_tokens = 0
+        self._client: Any = self._create_client(config)
+
+    @staticmethod
+    def _create_client(config: AutoTestConfig) -> Any:
+        """Create one API client shared by every review request.
+
+        The client owns the HTTP connection pool, so reusing it lets the
+        concurrent reviews share keep-alive connections and TLS sessions.
+        """
+        if not config.ai_api_key or anthropic is None:
+            return None
+        return anthropic.AsyncAnthropic(api_key=config.ai_api_key)
+
+    async def aclose(self) -> None:
+        """Close the shared API client and its connection pool."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
 
     async def review_functions(
         self,
@@ -63,35 +97,30 @@ class AICodeReviewer:
         Returns:
             Tuple of (findings, total_tokens_used).
         """
-        try:
-            import anthropic
-        except ImportError:
-            logger.warning("anthropic package not installed, skipping AI review")
-            return [], 0
-
         if not self.config.ai_api_key:
             logger.warning("No API key configured, skipping AI review")
             return [], 0
 
-        client = anthropic.AsyncAnthropic(api_key=self.config.ai_api_key)
+        if self._client is None:
+            logger.warning("anthropic package not installed, skipping AI review")
+            return [], 0
 
         # Limit to configured max
         max_funcs = self.config.ai_max_functions
         functions_to_review = functions[:max_funcs]
 
-        tasks = [
-            self._review_single(client, func, modules)
-            for func in functions_to_review
-        ]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        all_findings: list[Finding] = []
-        for result in results:
-            if isinstance(result, Exception):
-                logger.warning("AI review failed for a function: %s", result)
-                continue
-            all_findings.extend(result)
+        use_batch = (
+            self.config.ai_use_batch
+            and len(functions_to_review) >= self.config.ai_batch_threshold
+        )
+        if use_batch:
+            all_findings = await self._review_batch(
+                self._client, functions_to_review, modules
+            )
+        else:
+            all_findings = await self._review_concurrent(
+                self._client, functions_to_review, modules
+            )
 
         # Filter by confidence threshold
         min_confidence = self.config.min_finding_confidence
@@ -99,49 +128,171 @@ class AICodeReviewer:
 
         return filtered, self._total_tokens
 
-    async def _review_single(
+    async def _review_concurrent(
         self,
         client: Any,
-        func: FunctionMetrics,
+        functions: list[FunctionMetrics],
         modules: list[ModuleMetrics],
     ) -> list[Finding]:
-        """Review a single function using the Claude API."""
-        async with self._semaphore:
-            ctx = build_function_context(func, modules)
-
-            prompt = build_review_prompt(
-                source_code=func.source_code,
-                qualified_name=func.qualified_name,
-                language=func.language.value,
-                docstring=func.docstring,
-                imports=ctx.imports,
-                parent_class_source=ctx.parent_class_source,
-                sibling_functions=ctx.sibling_functions,
-            )
+        """Review functions with one concurrent messages.create call each.
 
+        Results are consumed as each request completes, so failures are
+        logged immediately and finished responses are not held behind the
+        slowest one. Findings are kept in input order for stable reports.
+        """
+
+        async def review_indexed(index: int, func: FunctionMetrics) -> tuple[int, list[Finding]]:
+            return index, await self._review_single(client, func, modules)
+
+        tasks = [
+            asyncio.ensure_future(review_indexed(i, func))
+            for i, func in enumerate(functions)
+        ]
+
+        by_index: dict[int, list[Finding]] = {}
+        for next_done in asyncio.as_completed(tasks):
             try:
-                response = await client.messages.create(
-                    model=self.config.ai_model,
-                    max_tokens=2000,
-                    system=REVIEW_SYSTEM_PROMPT,
-                    messages=[{"role": "user", "content": prompt}],
-                    tools=[REPORT_FINDINGS_TOOL],
-                    tool_choice={"type": "tool", "name": "report_findings"},
-                )
+                index, findings = await next_done
+            except Exception as e:
+                logger.warning("AI review failed for a function: %s", e)
+                continue
+            by_index[index] = findings
+
+        all_findings: list[Finding] = []
+        for index in sorted(by_index):
+            all_findings.extend(by_index[index])
+        return all_findings
+
+    async def _review_batch(
+        self,
+        client: Any,
+        functions: list[FunctionMetrics],
+        modules: list[ModuleMetrics],
+    ) -> list[Finding]:
+        """Review functions through the Message Batches API.
+
+        Submits every prompt in a single request, polls until the batch
+        has ended and maps each result back to its function by custom_id.
+        If the batch has not ended within ai_batch_timeout_seconds it is
+        cancelled and the functions are reviewed with direct calls instead.
+        """
+        # custom_id only allows [a-zA-Z0-9_-], so index instead of qualified_name
+        by_id = {f"fn-{i}": func for i, func in enumerate(functions)}
+        requests = [
+            {"custom_id": custom_id, "params": self._build_request(func, modules)}
+            for custom_id, func in by_id.items()
+        ]
 
-                # Track token usage
-                if hasattr(response, "usage"):
-                    self._total_tokens += (
-                        response.usage.input_tokens + response.usage.output_tokens
+        try:
+            batch = await client.messages.batches.create(requests=requests)
+            batch = await self._wait_for_batch(client, batch)
+            if batch is None:
+                return await self._review_concurrent(client, functions, modules)
+
+            all_findings: list[Finding] = []
+            async for entry in await client.messages.batches.results(batch.id):
+                func = by_id.get(entry.custom_id)
+                if func is None:
+                    continue
+                if entry.result.type != "succeeded":
+                    logger.warning(
+                        "AI batch review failed for %s: %s",
+                        func.qualified_name,
+                        entry.result.type,
                     )
+                    continue
+                message = entry.result.message
+                self._track_usage(message)
+                all_findings.extend(self._parse_response(message, func))
+        except Exception as e:
+            raise AIReviewError(f"AI batch review failed: {e}") from e
+
+        return all_findings
+
+    async def _wait_for_batch(self, client: Any, batch: Any) -> Any:
+        """Poll a batch until it has ended.
+
+        Returns the ended batch, or None after cancelling it when the
+        configured deadline passes first.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.ai_batch_timeout_seconds
+        while batch.processing_status != "ended":
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                logger.warning(
+                    "AI batch %s did not end within %ss, falling back to direct calls",
+                    batch.id,
+                    self.config.ai_batch_timeout_seconds,
+                )
+                try:
+                    await client.messages.batches.cancel(batch.id)
+                except Exception as e:
+                    logger.warning("Could not cancel AI batch %s: %s", batch.id, e)
+                return None
+            await asyncio.sleep(min(AI_BATCH_POLL_SECONDS, remaining))
+            batch = await client.messages.batches.retrieve(batch.id)
+        return batch
+
+    def _build_request(
+        self,
+        func: FunctionMetrics,
+        modules: list[ModuleMetrics],
+    ) -> dict[str, Any]:
+        """Build the messages.create parameters for reviewing one function."""
+        ctx = build_function_context(func, modules)
+
+        prompt = build_review_prompt(
+            source_code=func.source_code,
+            qualified_name=func.qualified_name,
+            language=func.language.value,
+            docstring=func.docstring,
+            imports=ctx.imports,
+            parent_class_source=ctx.parent_class_source,
+            sibling_functions=ctx.sibling_functions,
+        )
+
+        return {
+            "model": self.config.ai_model,
+            "max_tokens": 2000,
+            "system": REVIEW_SYSTEM_PROMPT,
+            "messages": [{"role": "user", "content": prompt}],
+            "tools": [REPORT_FINDINGS_TOOL],
+            "tool_choice": {"type": "tool", "name": "report_findings"},
+        }
+
+    def _track_usage(self, response: Any) -> None:
+        """Accumulate token usage from an API response."""
+        if hasattr(response, "usage"):
+            self._total_tokens += (
+                response.usage.input_tokens + response.usage.output_tokens
+            )
 
-                return self._parse_response(response, func)
+    async def _review_single(
+        self,
+        client: Any,
+        func: FunctionMetrics,
+        modules: list[ModuleMetrics],
+    ) -> list[Finding]:
+        """Review a single function using the Claude API."""
+        async with self._admission:
+            params = self._build_request(func, modules)
 
+            try:
+                response = await client.messages.create(**params)
+                self._track_usage(response)
+                findings = self._parse_response(response, func)
             except Exception as e:
+                # Back off the concurrency limit when the API rate-limits us
+                if anthropic is not None and isinstance(e, anthropic.RateLimitError):
+                    await self._admission.shrink()
                 raise AIReviewError(
                     f"AI review failed for {func.qualified_name}: {e}"
                 ) from e
 
+            await self._admission.record_success()
+            return findings
+
     def _parse_response(
         self,
         response: Any,
@@ -194,17 +345,21 @@ class AICodeReviewer:
         return findings
 
 
-def prioritize_functions(analysis: AnalysisReport) -> list[FunctionMetrics]:
+def prioritize_functions(
+    analysis: AnalysisReport,
+    limit: int | None = None,
+) -> list[FunctionMetrics]:
     """Prioritize functions for AI review.
 
     Order: high complexity + untested first, then high complexity tested,
     then untested public functions.
+
+    When ``limit`` is given only the top ``limit`` functions are selected,
+    using a bounded heap instead of sorting every candidate.
     """
     scored: list[tuple[float, FunctionMetrics]] = []
 
-    all_functions: list[FunctionMetrics] = []
-    for module in analysis.modules:
-        all_functions.extend(module.functions)
+    all_functions = chain.from_iterable(m.functions for m in analysis.modules)
 
     for func in all_functions:
         if not func.source_code or not func.source_code.strip():
@@ -223,5 +378,8 @@ def prioritize_functions(analysis: AnalysisReport) -> list[FunctionMetrics]:
             score -= 20
         scored.append((score, func))
 
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [func for _, func in scored]
+    if limit is not None:
+        top = heapq.nlargest(limit, scored, key=lambda x: x[0])
+    else:
+        top = sorted(scored, key=lambda x: x[0], reverse=True)
+    return [func for _, func in top]
@@ -53,6 +53,10 @@ def apply_fixes(
         AutoFixReport with results.
     """
     report = AutoFixReport()
+    # Each file is read once; fixes are applied to the in-memory text in
+    # finding order and every changed file is written once at the end.
+    contents: dict[Path, str] = {}
+    pending: dict[Path, list[FixResult]] = {}
 
     for finding in findings:
         fix = finding.suggested_fix
@@ -75,28 +79,31 @@ def apply_fixes(
             continue
 
         file_path = project_root / finding.file_path
-        if not file_path.exists():
-            report.failed.append(FixResult(
-                finding_id=finding.id,
-                file_path=finding.file_path,
-                applied=False,
-                message=f"Archivo no encontrado: {finding.file_path}",
-            ))
-            continue
+        if file_path not in contents:
+            if not file_path.exists():
+                report.failed.append(FixResult(
+                    finding_id=finding.id,
+                    file_path=finding.file_path,
+                    applied=False,
+                    message=f"Archivo no encontrado: {finding.file_path}",
+                ))
+                continue
 
-        try:
-            content = file_path.read_text(encoding="utf-8")
-        except (PermissionError, OSError) as e:
-            report.failed.append(FixResult(
-                finding_id=finding.id,
-                file_path=finding.file_path,
-                applied=False,
-                message=f"Error leyendo archivo: {e}",
-            ))
-            continue
+            try:
+                contents[file_path] = file_path.read_text(encoding="utf-8")
+            except (PermissionError, OSError) as e:
+                report.failed.append(FixResult(
+                    finding_id=finding.id,
+                    file_path=finding.file_path,
+                    applied=False,
+                    message=f"Error leyendo archivo: {e}",
+                ))
+                continue
+        content = contents[file_path]
 
-        # Check if code_before exists in the file
-        if fix.code_before not in content:
+        # Locate code_before once; the same offset is used for the splice below
+        start = content.find(fix.code_before)
+        if start < 0:
             # Try stripped version (whitespace differences)
             stripped_before = fix.code_before.strip()
             found = False
@@ -123,8 +130,7 @@ def apply_fixes(
             continue
 
         # Apply the fix
-        new_content = content.replace(fix.code_before, fix.code_after, 1)
-        if new_content == content:
+        if start < 0 or fix.code_after == fix.code_before:
             report.skipped.append(FixResult(
                 finding_id=finding.id,
                 file_path=finding.file_path,
@@ -132,22 +138,32 @@ def apply_fixes(
                 message="Reemplazo no produjo cambios",
             ))
             continue
-
+        end = start + len(fix.code_before)
+        contents[file_path] = content[:start] + fix.code_after + content[end:]
+
+        result = FixResult(
+            finding_id=finding.id,
+            file_path=finding.file_path,
+            applied=True,
+            message=f"Fix aplicado: {fix.description}",
+        )
+        report.applied.append(result)
+        pending.setdefault(file_path, []).append(result)
+
+    for file_path, results in pending.items():
         try:
-            file_path.write_text(new_content, encoding="utf-8")
-            report.applied.append(FixResult(
-                finding_id=finding.id,
-                file_path=finding.file_path,
-                applied=True,
-                message=f"Fix aplicado: {fix.description}",
-            ))
-            logger.info("Applied fix %s to %s", finding.id, finding.file_path)
+            file_path.write_text(contents[file_path], encoding="utf-8")
         except (PermissionError, OSError) as e:
-            report.failed.append(FixResult(
-                finding_id=finding.id,
-                file_path=finding.file_path,
-                applied=False,
-                message=f"Error escribiendo archivo: {e}",
-            ))
+            for result in results:
+                report.applied.remove(result)
+                report.failed.append(FixResult(
+                    finding_id=result.finding_id,
+                    file_path=result.file_path,
+                    applied=False,
+                    message=f"Error escribiendo archivo: {e}",
+                ))
+            continue
+        for result in results:
+            logger.info("Applied fix %s to %s", result.finding_id, result.file_path)
 
     return report
@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import functools
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from autotest.models.analysis import FunctionMetrics, ModuleMetrics
 
+# Leading blank/comment lines, then a triple-quoted string up to its closing
+# quotes (or end of file when unterminated)
+_MODULE_DOCSTRING_RE = re.compile(
+    r"(?:[^\S\n]*(?:#[^\n]*)?\n)*[^\S\n]*(\"\"\"|''')(.*?)(?:\1|\Z)",
+    re.DOTALL,
+)
+
 
 @dataclass
 class ModuleContext:
@@ -73,31 +82,46 @@ def _find_module(
     return None
 
 
-def _extract_class_source(file_path: Path, class_name: str) -> str:
-    """Extract the full source of a class from a file."""
+def _read_source(file_path: Path) -> str:
+    """Read a source file, memoized on (path, mtime, size).
+
+    Class and docstring extraction both need the file, and several reviewed
+    functions usually share one module, so each file is read only once.
+    """
+    try:
+        st = file_path.stat()
+    except OSError:
+        return ""
+    return _read_source_cached(file_path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=256)
+def _read_source_cached(file_path: Path, mtime_ns: int, size: int) -> str:
     try:
-        source = file_path.read_text(encoding="utf-8", errors="ignore")
+        return file_path.read_text(encoding="utf-8", errors="ignore")
     except (PermissionError, OSError):
         return ""
 
-    lines = source.splitlines()
-    class_start = -1
-    class_indent = 0
 
-    for i, line in enumerate(lines):
-        stripped = line.lstrip()
-        if stripped.startswith(f"class {class_name}"):
-            class_start = i
-            class_indent = len(line) - len(stripped)
-            break
+def _extract_class_source(file_path: Path, class_name: str) -> str:
+    """Extract the full source of a class from a file."""
+    source = _read_source(file_path)
+    if not source:
+        return ""
 
-    if class_start == -1:
+    # Locate the class header directly instead of splitting the whole file
+    match = re.search(
+        rf"^([^\S\n]*)class {re.escape(class_name)}", source, re.MULTILINE
+    )
+    if match is None:
         return ""
 
+    class_indent = len(match.group(1))
+    lines = source[match.start():].splitlines()
+
     # Collect lines until we hit a line at the same or lower indentation
-    class_lines = [lines[class_start]]
-    for i in range(class_start + 1, len(lines)):
-        line = lines[i]
+    class_lines = [lines[0]]
+    for line in lines[1:]:
         if line.strip() == "":
             class_lines.append(line)
             continue
@@ -116,33 +140,11 @@ def _extract_class_source(file_path: Path, class_name: str) -> str:
 
 def _extract_module_docstring(file_path: Path) -> str:
     """Extract the module-level docstring from a Python file."""
-    try:
-        source = file_path.read_text(encoding="utf-8", errors="ignore")
-    except (PermissionError, OSError):
+    source = _read_source(file_path)
+    if not source:
         return ""
 
-    lines = source.splitlines()
-    if not lines:
+    match = _MODULE_DOCSTRING_RE.match(source)
+    if match is None:
         return ""
-
-    # Check for module docstring (first non-comment, non-empty line)
-    for line in lines:
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        if stripped.startswith('"""') or stripped.startswith("'''"):
-            # Find the end of the docstring
-            quote = stripped[:3]
-            if stripped.count(quote) >= 2:
-                return stripped.strip(quote).strip()
-            # Multi-line docstring
-            doc_lines = [stripped.lstrip(quote)]
-            for next_line in lines[lines.index(line) + 1:]:
-                if quote in next_line:
-                    doc_lines.append(next_line.split(quote)[0])
-                    break
-                doc_lines.append(next_line)
-            return "\n".join(doc_lines).strip()
-        break  # Not a docstring
-
-    return ""
+    return match.group(2).strip()
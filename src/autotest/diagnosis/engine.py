@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
 
@@ -32,41 +33,25 @@ class DiagnosisEngine:
         1. Static findings (always, free, fast)
         2. Security scan (always, no subprocess)
         3. AI review (only if ai_enabled and api_key exists)
+
+        The security scan is blocking file I/O and the AI review waits on
+        the network, so both run concurrently.
         """
         all_findings: list[Finding] = []
-        ai_tokens = 0
-        functions_analyzed = 0
 
         # 1. Static findings from analysis data
         static = generate_static_findings(analysis)
         all_findings.extend(static)
         logger.info("Static analysis: %d findings", len(static))
 
-        # 2. Security scan
-        security = scan_for_secrets(project.root_path)
+        # 2 + 3. Security scan in a worker thread, overlapped with AI review
+        security, (ai_findings, ai_tokens, functions_analyzed) = await asyncio.gather(
+            asyncio.to_thread(scan_for_secrets, project.root_path),
+            self._run_ai_review(analysis),
+        )
         all_findings.extend(security)
         logger.info("Security scan: %d findings", len(security))
-
-        # 3. AI review (optional)
-        if self.config.ai_enabled and self.config.ai_api_key:
-            try:
-                reviewer = AICodeReviewer(self.config)
-                prioritized = prioritize_functions(analysis)
-                functions_analyzed = min(
-                    len(prioritized), self.config.ai_max_functions
-                )
-                ai_findings, ai_tokens = await reviewer.review_functions(
-                    prioritized, analysis.modules
-                )
-                all_findings.extend(ai_findings)
-                logger.info(
-                    "AI review: %d findings from %d functions (%d tokens)",
-                    len(ai_findings),
-                    functions_analyzed,
-                    ai_tokens,
-                )
-            except Exception as e:
-                logger.warning("AI review failed, continuing with static findings: %s", e)
+        all_findings.extend(ai_findings)
 
         # Normalize file paths to relative
         self._relativize_paths(all_findings, project.root_path)
@@ -118,6 +103,45 @@ class DiagnosisEngine:
             functions_analyzed=functions_analyzed,
         )
 
+    async def _run_ai_review(
+        self,
+        analysis: AnalysisReport,
+    ) -> tuple[list[Finding], int, int]:
+        """Run the optional AI review.
+
+        Returns:
+            Tuple of (findings, tokens_used, functions_analyzed).
+        """
+        if not (self.config.ai_enabled and self.config.ai_api_key):
+            return [], 0, 0
+
+        reviewer: AICodeReviewer | None = None
+        functions_analyzed = 0
+        try:
+            reviewer = AICodeReviewer(self.config)
+            prioritized = prioritize_functions(
+                analysis, limit=self.config.ai_max_functions
+            )
+            functions_analyzed = min(
+                len(prioritized), self.config.ai_max_functions
+            )
+            ai_findings, ai_tokens = await reviewer.review_functions(
+                prioritized, analysis.modules
+            )
+            logger.info(
+                "AI review: %d findings from %d functions (%d tokens)",
+                len(ai_findings),
+                functions_analyzed,
+                ai_tokens,
+            )
+            return ai_findings, ai_tokens, functions_analyzed
+        except Exception as e:
+            logger.warning("AI review failed, continuing with static findings: %s", e)
+            return [], 0, functions_analyzed
+        finally:
+            if reviewer is not None:
+                await reviewer.aclose()
+
     def _calculate_health_score(
         self,
         critical: int,
@@ -12,40 +12,63 @@ from autotest.models.diagnosis import (
     SuggestedFix,
 )
 
-# Reused from executor/phases/security.py with same patterns
-SECRET_PATTERNS: list[tuple[str, str, str]] = [
+# Reused from executor/phases/security.py with same patterns.
+# Compiled once at import so the per-line loop only pays for search().
+SECRET_PATTERNS: list[tuple[re.Pattern[str], str, str]] = [
     (
-        r"(?i)(api[_-]?key|apikey)\s*[:=]\s*['\"][A-Za-z0-9]{16,}",
+        re.compile(r"(?i)(api[_-]?key|apikey)\s*[:=]\s*['\"][A-Za-z0-9]{16,}"),
         "API key hardcodeada",
         "Mover a variable de entorno",
     ),
     (
-        r"(?i)(secret|password|passwd|pwd)\s*[:=]\s*['\"][^'\"]{8,}",
+        re.compile(r"(?i)(secret|password|passwd|pwd)\s*[:=]\s*['\"][^'\"]{8,}"),
         "Secreto hardcodeado",
         "Mover a variable de entorno o vault",
     ),
     (
-        r"(?i)(aws_access_key_id)\s*[:=]\s*['\"]?AKIA[A-Z0-9]{16}",
+        re.compile(r"(?i)(aws_access_key_id)\s*[:=]\s*['\"]?AKIA[A-Z0-9]{16}"),
         "AWS access key expuesta",
         "Usar IAM roles o AWS Secrets Manager",
     ),
     (
-        r"(?i)(private[_-]?key)\s*[:=]\s*['\"]-----BEGIN",
+        re.compile(r"(?i)(private[_-]?key)\s*[:=]\s*['\"]-----BEGIN"),
         "Clave privada embebida",
         "Mover a archivo seguro fuera del repositorio",
     ),
     (
-        r"(?i)(token)\s*[:=]\s*['\"][A-Za-z0-9_\-]{20,}",
+        re.compile(r"(?i)(token)\s*[:=]\s*['\"][A-Za-z0-9_\-]{20,}"),
         "Token hardcodeado",
         "Usar variable de entorno",
     ),
     (
-        r"jdbc:[a-z]+://[^:]+:[^@]+@",
+        re.compile(r"jdbc:[a-z]+://[^:]+:[^@]+@"),
         "Connection string con credenciales",
         "Usar variables de entorno para credenciales de base de datos",
     ),
 ]
 
+
+def _fuse_patterns(patterns: list[tuple[re.Pattern[str], str, str]]) -> re.Pattern[str]:
+    """Combine all secret patterns into a single alternation.
+
+    Inline ``(?i)`` prefixes are rewritten as scoped ``(?i:...)`` groups since
+    global flags are only allowed at the start of an expression.
+    """
+    parts: list[str] = []
+    for rx, _label, _fix in patterns:
+        source = rx.pattern
+        if source.startswith("(?i)"):
+            parts.append(f"(?i:{source[4:]})")
+        else:
+            parts.append(f"(?:{source})")
+    return re.compile("|".join(parts))
+
+
+# One pass over a file (or line) tells us whether any secret pattern can match
+_ANY_SECRET_RE = _fuse_patterns(SECRET_PATTERNS)
+
+_ASSIGNMENT_RE = re.compile(r"(\w+)\s*[:=]")
+
 _SKIP_DIRS = {"node_modules", ".git", "__pycache__", ".venv", "venv", "dist", "build", ".tox", ".nox"}
 
 _TEST_INDICATORS = {"tests", "test", "__tests__", "spec", "fixtures", "conftest"}
@@ -80,22 +103,29 @@ def scan_for_secrets(project_root: Path) -> list[Finding]:
     for path in project_root.rglob("*"):
         if not path.is_file():
             continue
-        if any(skip in path.parts for skip in _SKIP_DIRS):
-            continue
         if path.suffix not in _SCANNABLE_EXTENSIONS:
             continue
+        if not _SKIP_DIRS.isdisjoint(path.parts):
+            continue
 
         try:
-            lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
+            content = path.read_text(encoding="utf-8", errors="ignore")
         except (PermissionError, OSError):
             continue
 
+        # Most files contain no secrets: skip them after a single scan
+        if not _ANY_SECRET_RE.search(content):
+            continue
+
+        lines = content.splitlines()
         relative = str(path.relative_to(project_root))
         is_test = _is_test_file(path)
 
         for line_num, line_text in enumerate(lines, start=1):
+            if not _ANY_SECRET_RE.search(line_text):
+                continue
             for pattern, label, fix_desc in SECRET_PATTERNS:
-                if re.search(pattern, line_text):
+                if pattern.search(line_text):
                     env_var_name = _suggest_env_var(label, line_text)
 
                     # Test files get INFO severity (mock values, not real secrets)
@@ -157,7 +187,7 @@ def scan_for_secrets(project_root: Path) -> list[Finding]:
 def _suggest_env_var(label: str, line: str) -> str:
     """Suggest an environment variable name based on the finding."""
     # Try to extract the variable name from the line
-    match = re.search(r"(\w+)\s*[:=]", line)
+    match = _ASSIGNMENT_RE.search(line)
     if match:
         return match.group(1).upper()
     # Fallback based on label
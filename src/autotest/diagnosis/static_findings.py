@@ -130,16 +130,16 @@ def _coupling_findings(analysis: AnalysisReport) -> list[Finding]:
 def _missing_tests_findings(analysis: AnalysisReport) -> list[Finding]:
     """Generate findings for untested functions with high complexity."""
     findings: list[Finding] = []
-    # Only flag untested functions that also have notable complexity
-    critical_untested = [
-        f for f in analysis.untested_functions
-        if f.cyclomatic_complexity >= COMPLEXITY_HIGH
-    ]
-    important_untested = [
-        f for f in analysis.untested_functions
-        if f.cyclomatic_complexity >= 5 and f.cyclomatic_complexity < COMPLEXITY_HIGH
-        and f.is_public
-    ]
+    # Only flag untested functions that also have notable complexity.
+    # Partition in a single pass over the untested list.
+    critical_untested: list[FunctionMetrics] = []
+    important_untested: list[FunctionMetrics] = []
+    for f in analysis.untested_functions:
+        cc = f.cyclomatic_complexity
+        if cc >= COMPLEXITY_HIGH:
+            critical_untested.append(f)
+        elif cc >= 5 and f.is_public:
+            important_untested.append(f)
 
     for func in critical_untested:
         findings.append(Finding(
@@ -26,3 +26,61 @@ async def run_in_executor(func: Callable[..., T], *args: Any) -> T:
     """Run a synchronous function in a thread executor."""
     loop = asyncio.get_event_loop()
     return await loop.run_in_executor(None, func, *args)
+
+
+class AdmissionController:
+    """Adaptive concurrency limit for rate-limited APIs (AIMD).
+
+    Works like a semaphore whose limit can change at runtime: ``shrink()``
+    halves the limit (e.g. after a 429), and every ``grow_after`` consecutive
+    successes add one slot back, up to ``max_limit``.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        max_limit: int | None = None,
+        grow_after: int = 10,
+    ) -> None:
+        self._max = max(1, limit)
+        self._ceiling = max(self._max, max_limit or limit)
+        self._grow_after = grow_after
+        self._active = 0
+        self._streak = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return self._max
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._max)
+            self._active += 1
+
+    async def release(self) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+
+    async def shrink(self) -> None:
+        """Multiplicative decrease after the server pushed back."""
+        async with self._cond:
+            self._max = max(1, self._max // 2)
+            self._streak = 0
+
+    async def record_success(self) -> None:
+        """Additive increase after a run of successful requests."""
+        async with self._cond:
+            self._streak += 1
+            if self._streak >= self._grow_after and self._max < self._ceiling:
+                self._max += 1
+                self._streak = 0
+                self._cond.notify(1)
+
+    async def __aenter__(self) -> AdmissionController:
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.release()
@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+import fnmatch
+import functools
+import os
+import re
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from autotest.constants import SKIP_DIRS
@@ -15,14 +21,52 @@ def should_skip_dir(dir_name: str) -> bool:
 def count_lines(file_path: Path) -> int:
     """Count non-empty lines in a file."""
     try:
-        content = safe_read(file_path)
-        return len([line for line in content.splitlines() if line.strip()])
+        return count_source_lines(safe_read(file_path))
     except Exception:
         return 0
 
 
+def total_lines(files: list[Path]) -> int:
+    """Sum non-empty lines across files, reading them on a thread pool.
+
+    File reads release the GIL, so overlapping them hides filesystem latency;
+    the contents also land in the safe_read cache for the analysis that follows.
+    """
+    if len(files) < 2:
+        return sum(count_lines(f) for f in files)
+    with ThreadPoolExecutor(max_workers=min(_io_workers(), len(files))) as pool:
+        return sum(pool.map(count_lines, files))
+
+
+def _io_workers() -> int:
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS/Windows
+        cpus = os.cpu_count() or 1
+    return cpus * 4
+
+
+def count_source_lines(source: str) -> int:
+    """Count non-empty lines in already-read source text."""
+    return sum(1 for line in source.splitlines() if line.strip())
+
+
 def safe_read(file_path: Path, encoding: str = "utf-8") -> str:
-    """Safely read a file, handling encoding errors."""
+    """Safely read a file, handling encoding errors.
+
+    Contents are cached per (path, mtime, size), so the detector, parsers and
+    analyzer passes over the same unchanged file only read it from disk once.
+    """
+    try:
+        stat = file_path.stat()
+    except Exception:
+        return ""
+    return _read_cached(str(file_path), stat.st_mtime_ns, stat.st_size, encoding)
+
+
+@functools.lru_cache(maxsize=4096)
+def _read_cached(path: str, mtime_ns: int, size: int, encoding: str) -> str:
+    file_path = Path(path)
     try:
         return file_path.read_text(encoding=encoding)
     except UnicodeDecodeError:
@@ -34,25 +78,132 @@ def safe_read(file_path: Path, encoding: str = "utf-8") -> str:
         return ""
 
 
+def safe_read_lower(file_path: Path) -> str:
+    """Lowercased safe_read(), for case-insensitive scans of build files.
+
+    Cached per (path, mtime, size) like safe_read, so detectors that check the
+    same manifest from several methods only lowercase it once.
+    """
+    try:
+        stat = file_path.stat()
+    except Exception:
+        return ""
+    return _lower_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=256)
+def _lower_cached(path: str, mtime_ns: int, size: int) -> str:
+    return _read_cached(path, mtime_ns, size, "utf-8").lower()
+
+
 def collect_files(root: Path, extensions: set[str] | None = None) -> list[Path]:
     """Collect all files under root, respecting skip directories."""
     files: list[Path] = []
-    if not root.is_dir():
-        return files
-
-    for item in root.iterdir():
-        if item.is_dir():
-            if not should_skip_dir(item.name):
-                files.extend(collect_files(item, extensions))
-        elif item.is_file():
-            if extensions is None or item.suffix in extensions:
-                files.append(item)
+    if root.is_dir():
+        _collect_into(str(root), extensions, files)
     return files
 
 
-def find_files_by_pattern(root: Path, patterns: list[str]) -> list[Path]:
-    """Find files matching glob patterns under root."""
-    found: list[Path] = []
+def _collect_into(directory: str, extensions: set[str] | None, files: list[Path]) -> None:
+    # os.scandir yields the entry type from the directory listing itself, so
+    # unlike Path.iterdir() + is_dir()/is_file() it needs no stat per entry.
+    try:
+        with os.scandir(directory) as entries:
+            entries = list(entries)
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_dir():
+                if not should_skip_dir(entry.name):
+                    _collect_into(entry.path, extensions, files)
+            elif entry.is_file():
+                if extensions is None or os.path.splitext(entry.name)[1] in extensions:
+                    files.append(Path(entry.path))
+        except OSError:
+            continue
+
+
+def find_files_by_pattern(root: Path, patterns: Sequence[str]) -> list[Path]:
+    """Find files matching glob patterns under root.
+
+    Patterns have Path.rglob semantics (matched at any depth, ``**`` spans
+    directories), but they are tested against a single collect_files() walk:
+    skip directories are pruned like for source files, and the tree is
+    walked once for all patterns rather than once per pattern.
+    """
+    if not patterns:
+        return []
+    return _filter_by_patterns(root, collect_files(root), patterns)
+
+
+def _filter_by_patterns(root: Path, files: list[Path], patterns: Sequence[str]) -> list[Path]:
+    names, globs = _compile_patterns(tuple(patterns))
+    matched: list[Path] = []
+    for f in files:
+        if names is not None and names.match(f.name):
+            matched.append(f)
+        elif globs:
+            parts = f.relative_to(root).parts
+            if any(_match_glob(glob, parts) for glob in globs):
+                matched.append(f)
+    return matched
+
+
+_Glob = tuple[re.Pattern[str] | None, ...]  # one regex per path segment, None for "**"
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_patterns(patterns: tuple[str, ...]) -> tuple[re.Pattern[str] | None, list[_Glob]]:
+    """Split patterns into one fnmatch regex for bare file-name patterns and
+    per-segment regexes for patterns that span directories."""
+    names: list[str] = []
+    globs: list[_Glob] = []
     for pattern in patterns:
-        found.extend(root.rglob(pattern))
-    return list(set(found))
+        segments = pattern.split("/")
+        if len(segments) == 1:
+            names.append(fnmatch.translate(pattern))
+        elif segments[-1] != "**":  # a trailing "**" only matches directories
+            globs.append(tuple(
+                None if seg == "**" else re.compile(fnmatch.translate(seg)) for seg in segments
+            ))
+    return (re.compile("|".join(names)) if names else None), globs
+
+
+def _match_glob(glob: _Glob, parts: tuple[str, ...]) -> bool:
+    """rglob matching: the pattern may start at any depth but must reach the end."""
+    return any(_match_from(glob, parts[start:]) for start in range(len(parts)))
+
+
+def _match_from(glob: _Glob, parts: tuple[str, ...]) -> bool:
+    if not glob:
+        return not parts
+    segment = glob[0]
+    if segment is None:
+        return any(_match_from(glob[1:], parts[skip:]) for skip in range(len(parts) + 1))
+    return bool(parts) and segment.match(parts[0]) is not None and _match_from(glob[1:], parts[1:])
+
+
+class FileIndex:
+    """A single collect_files() walk of root, reused for repeated lookups.
+
+    The scanner builds one and hands it to every detector, so the tree is
+    walked once per scan instead of once per language and lookup.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.files = collect_files(root)
+        self._suffixes = [os.path.splitext(f.name)[1] for f in self.files]
+
+    def collect_files(self, extensions: set[str] | None = None) -> list[Path]:
+        """Same result as collect_files(root, extensions), in walk order."""
+        if extensions is None:
+            return list(self.files)
+        return [f for f, ext in zip(self.files, self._suffixes, strict=True) if ext in extensions]
+
+    def find_files_by_pattern(self, patterns: Sequence[str]) -> list[Path]:
+        """Same result as find_files_by_pattern(root, patterns)."""
+        if not patterns:
+            return []
+        return _filter_by_patterns(self.root, self.files, patterns)
@@ -0,0 +1,217 @@
+"""Tests for the AI code reviewer (Anthropic API mocked)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from autotest.config import AutoTestConfig
+from autotest.diagnosis.ai_reviewer import AICodeReviewer, prioritize_functions
+from autotest.models.analysis import AnalysisReport, FunctionMetrics, ModuleMetrics
+from autotest.models.project import Language
+
+
+def _make_function(name: str, complexity: int = 5) -> FunctionMetrics:
+    return FunctionMetrics(
+        name=name,
+        qualified_name=name,
+        file_path=Path("/tmp/project/app.py"),
+        line_start=10,
+        line_end=20,
+        language=Language.PYTHON,
+        source_code=f"def {name}(x):\n    return x\n",
+        cyclomatic_complexity=complexity,
+    )
+
+
+def _tool_response(title: str) -> SimpleNamespace:
+    block = SimpleNamespace(
+        type="tool_use",
+        name="report_findings",
+        input={"findings": [{
+            "severity": "warning",
+            "category": "bug",
+            "title": title,
+            "description": "desc",
+            "line_start": 2,
+            "confidence": 0.9,
+        }]},
+    )
+    return SimpleNamespace(
+        content=[block],
+        usage=SimpleNamespace(input_tokens=100, output_tokens=50),
+    )
+
+
+def _fake_client(responses: list[SimpleNamespace]) -> SimpleNamespace:
+    return SimpleNamespace(
+        messages=SimpleNamespace(create=AsyncMock(side_effect=responses)),
+        close=AsyncMock(),
+    )
+
+
+class _AsyncResults:
+    def __init__(self, entries: list[SimpleNamespace]) -> None:
+        self._entries = entries
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for entry in self._entries:
+            yield entry
+
+
+class TestReviewFunctions:
+
+    @pytest.mark.asyncio
+    async def test_reuses_single_client(self, ai_config: AutoTestConfig) -> None:
+        reviewer = AICodeReviewer(ai_config)
+        client = _fake_client([_tool_response("a"), _tool_response("b")])
+        reviewer._client = client
+
+        funcs = [_make_function("alpha"), _make_function("beta")]
+        findings, tokens = await reviewer.review_functions(funcs, [ModuleMetrics(
+            file_path=Path("/tmp/project/app.py"), language=Language.PYTHON, functions=funcs,
+        )])
+
+        assert client.messages.create.await_count == 2
+        assert {f.title for f in findings} == {"a", "b"}
+        assert tokens == 300
+
+    @pytest.mark.asyncio
+    async def test_concurrency_grows_past_start_after_successes(
+        self, ai_config: AutoTestConfig
+    ) -> None:
+        ai_config.ai_max_functions = 20
+        reviewer = AICodeReviewer(ai_config)
+        start = reviewer._admission.limit
+        reviewer._client = _fake_client([_tool_response(f"t{i}") for i in range(20)])
+
+        await reviewer.review_functions([_make_function(f"f{i}") for i in range(20)], [])
+
+        assert start == 3
+        assert reviewer._admission.limit > start
+
+    @pytest.mark.asyncio
+    async def test_failed_request_keeps_other_findings(self, ai_config: AutoTestConfig) -> None:
+        reviewer = AICodeReviewer(ai_config)
+        reviewer._client = _fake_client([RuntimeError("boom"), _tool_response("ok")])
+
+        findings, _ = await reviewer.review_functions(
+            [_make_function("alpha"), _make_function("beta")], []
+        )
+
+        assert [f.title for f in findings] == ["ok"]
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_client(self, ai_config: AutoTestConfig) -> None:
+        reviewer = AICodeReviewer(ai_config)
+        client = _fake_client([])
+        reviewer._client = client
+
+        await reviewer.aclose()
+
+        client.close.assert_awaited_once()
+        assert reviewer._client is None
+
+    @pytest.mark.asyncio
+    async def test_no_api_key_skips_review(self, default_config: AutoTestConfig) -> None:
+        reviewer = AICodeReviewer(default_config)
+        findings, tokens = await reviewer.review_functions([_make_function("alpha")], [])
+        assert findings == []
+        assert tokens == 0
+
+
+class TestBatchReview:
+
+    @pytest.mark.asyncio
+    async def test_batch_maps_results_by_custom_id(self, ai_config: AutoTestConfig) -> None:
+        ai_config.ai_use_batch = True
+        ai_config.ai_batch_threshold = 2
+        reviewer = AICodeReviewer(ai_config)
+        entries = [
+            SimpleNamespace(
+                custom_id="fn-1",
+                result=SimpleNamespace(type="succeeded", message=_tool_response("from beta")),
+            ),
+            SimpleNamespace(custom_id="fn-0", result=SimpleNamespace(type="errored")),
+        ]
+        batches = SimpleNamespace(
+            create=AsyncMock(return_value=SimpleNamespace(id="b1", processing_status="ended")),
+            retrieve=AsyncMock(),
+            results=AsyncMock(return_value=_AsyncResults(entries)),
+        )
+        client = _fake_client([])
+        client.messages.batches = batches
+        reviewer._client = client
+
+        funcs = [_make_function("alpha"), _make_function("beta")]
+        findings, tokens = await reviewer.review_functions(funcs, [])
+
+        assert client.messages.create.await_count == 0
+        requests = batches.create.await_args.kwargs["requests"]
+        assert [r["custom_id"] for r in requests] == ["fn-0", "fn-1"]
+        assert [f.function_name for f in findings] == ["beta"]
+        assert tokens == 150
+
+    @pytest.mark.asyncio
+    async def test_batch_timeout_cancels_and_falls_back(
+        self, ai_config: AutoTestConfig, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("autotest.diagnosis.ai_reviewer.AI_BATCH_POLL_SECONDS", 0.01)
+        ai_config.ai_use_batch = True
+        ai_config.ai_batch_threshold = 2
+        ai_config.ai_batch_timeout_seconds = 0.05
+        reviewer = AICodeReviewer(ai_config)
+        pending = SimpleNamespace(id="b1", processing_status="in_progress")
+        batches = SimpleNamespace(
+            create=AsyncMock(return_value=pending),
+            retrieve=AsyncMock(return_value=pending),
+            cancel=AsyncMock(),
+            results=AsyncMock(),
+        )
+        client = _fake_client([_tool_response("a"), _tool_response("b")])
+        client.messages.batches = batches
+        reviewer._client = client
+
+        funcs = [_make_function("alpha"), _make_function("beta")]
+        findings, tokens = await reviewer.review_functions(funcs, [])
+
+        assert batches.retrieve.await_count >= 1
+        batches.cancel.assert_awaited_once_with("b1")
+        assert batches.results.await_count == 0
+        assert client.messages.create.await_count == 2
+        assert [f.function_name for f in findings] == ["alpha", "beta"]
+        assert tokens == 300
+
+    @pytest.mark.asyncio
+    async def test_below_threshold_uses_direct_calls(self, ai_config: AutoTestConfig) -> None:
+        ai_config.ai_use_batch = True
+        ai_config.ai_batch_threshold = 5
+        reviewer = AICodeReviewer(ai_config)
+        client = _fake_client([_tool_response("a")])
+        reviewer._client = client
+
+        findings, _ = await reviewer.review_functions([_make_function("alpha")], [])
+
+        assert client.messages.create.await_count == 1
+        assert len(findings) == 1
+
+
+class TestPrioritizeFunctions:
+
+    def test_limit_matches_full_sort_prefix(self) -> None:
+        funcs = [_make_function(f"f{i}", complexity=c) for i, c in enumerate([3, 12, 7, 12, 1, 30])]
+        analysis = AnalysisReport(modules=[ModuleMetrics(
+            file_path=Path("/tmp/project/app.py"), language=Language.PYTHON, functions=funcs,
+        )])
+
+        full = prioritize_functions(analysis)
+        top = prioritize_functions(analysis, limit=3)
+
+        assert [f.name for f in top] == [f.name for f in full[:3]]
+        assert [f.name for f in top] == ["f5", "f1", "f3"]
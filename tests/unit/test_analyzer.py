@@ -6,10 +6,20 @@ from pathlib import Path
 
 import pytest
 
+from autotest.analyzer import engine as analyzer_engine
 from autotest.analyzer.complexity import calculate_complexity
+from autotest.analyzer.coupling import calculate_coupling
+from autotest.analyzer.coverage_gap import find_untested_functions
+from autotest.analyzer.dead_code import detect_dead_code
+from autotest.analyzer.engine import AnalysisEngine
+from autotest.analyzer.parsers.base import count_params
+from autotest.analyzer.parsers.go_parser import GoParser
+from autotest.analyzer.parsers.js_parser import JSParser
 from autotest.analyzer.parsers.python_parser import PythonParser
-from autotest.models.analysis import FunctionMetrics
-from autotest.models.project import Language
+from autotest.config import AutoTestConfig
+from autotest.detector.scanner import ProjectScanner
+from autotest.models.analysis import FunctionMetrics, ModuleMetrics
+from autotest.models.project import Language, LanguageInfo
 
 
 class TestPythonParser:
@@ -48,6 +58,96 @@ from typing import Optional
         assert "os" in imports
         assert "pathlib" in imports
 
+    def test_parse_returns_functions_and_imports(self) -> None:
+        source = "import os\n\ndef load(path):\n    return os.path.exists(path)\n"
+        functions, imports = PythonParser().parse(Path("app.py"), source)
+        assert [f.name for f in functions] == ["load"]
+        assert imports == ["os"]
+
+    def test_qualified_names_use_outermost_class(self) -> None:
+        source = (
+            "def top():\n    def helper():\n        pass\n\n"
+            "class Outer:\n    class Inner:\n        def run(self):\n            pass\n"
+        )
+        functions, _ = PythonParser().parse(Path("app.py"), source)
+        assert [f.qualified_name for f in functions] == ["top", "helper", "Outer.run"]
+
+    def test_scores_methods_from_module_ast(self, tmp_path: Path) -> None:
+        source = '''
+class Router:
+    def route(self, path):
+        if path == "/":
+            return "home"
+        elif path.startswith("/api"):
+            return "api"
+        return None
+'''
+        f = tmp_path / "router.py"
+        f.write_text(source)
+        functions = PythonParser().parse_functions(f)
+        assert [fn.cyclomatic_complexity for fn in functions] == [3]
+
+
+class TestRegexParsers:
+
+    def test_go_line_numbers(self) -> None:
+        source = (
+            "package main\n\n"
+            "func Add(a, b int) int {\n\treturn a + b\n}\n\n"
+            "func (s *Server) handle(w, r) {\n}\n"
+        )
+        functions, _ = GoParser().parse(Path("main.go"), source)
+        assert [(f.name, f.line_start, f.is_public) for f in functions] == [
+            ("Add", 3, True),
+            ("handle", 7, False),
+        ]
+
+    def test_js_function_forms(self) -> None:
+        source = (
+            "export async function load(url, opts) {\n}\n"
+            "const render = (view) => {\n};\n"
+            "class Store {\n"
+            "  save(item) {\n"
+            "    if (item) {\n    }\n"
+            "  }\n"
+            "}\n"
+        )
+        functions, _ = JSParser().parse(Path("app.js"), source)
+        assert [(f.name, f.line_start, f.parameters_count) for f in functions] == [
+            ("load", 1, 2),
+            ("render", 3, 1),
+            ("save", 6, 1),
+        ]
+
+    def test_js_declarations_take_priority_over_other_forms(self) -> None:
+        source = (
+            "class View {\n"
+            "  render(x) {\n"
+            "  }\n"
+            "}\n\n"
+            "function render(a, b, c) {\n}\n"
+            "const load = async (p) => {\n};\n"
+            "export async function load(q, r) {\n}\n"
+        )
+        functions, _ = JSParser().parse(Path("view.js"), source)
+        assert [(f.name, f.line_start, f.parameters_count) for f in functions] == [
+            ("render", 6, 3),
+            ("load", 10, 2),
+        ]
+
+    @pytest.mark.parametrize(("params", "expected"), [
+        ("", 0),
+        ("  ", 0),
+        ("a, b", 2),
+        ("a, b,", 2),
+        ("Map<String, List<Integer>> m, int n", 2),
+        ("Func<int, bool> pred", 1),
+        ("{ a, b }, cb = (x, y) => x", 2),
+        ("f: impl Fn(u8) -> u8, n: usize", 2),
+    ])
+    def test_count_params_ignores_nested_commas(self, params: str, expected: int) -> None:
+        assert count_params(params) == expected
+
 
 class TestComplexity:
 
@@ -89,3 +189,141 @@ class TestComplexity:
         )
         score = calculate_complexity(func)
         assert score > 1
+
+    def test_generic_branch_counting(self) -> None:
+        source = (
+            "function pick(a, b) {\n"
+            "    if (a && b) { return 1; }\n"
+            "    else if (a || b) { return 2; }\n"
+            "    return a ? 3 : 4;\n"
+            "}\n"
+        )
+        func = FunctionMetrics(
+            name="pick",
+            qualified_name="pick",
+            file_path=Path("test.js"),
+            line_start=1,
+            line_end=5,
+            language=Language.JAVASCRIPT,
+            source_code=source,
+        )
+        # base + if + && + else-if + || + ternary
+        assert calculate_complexity(func) == 6
+
+
+class TestCoupling:
+
+    def test_resolves_dotted_and_stem_imports(self) -> None:
+        models = ModuleMetrics(file_path=Path("/p/app/models.py"), language=Language.PYTHON)
+        posts = ModuleMetrics(file_path=Path("/p/app/posts.py"), language=Language.PYTHON)
+        views = ModuleMetrics(
+            file_path=Path("/p/app/views.py"),
+            language=Language.PYTHON,
+            imports=["app.models", "os"],
+        )
+
+        coupling = {c.module_path.name: c for c in calculate_coupling([models, posts, views])}
+
+        assert coupling["views.py"].efferent_coupling == 1
+        assert coupling["models.py"].afferent_coupling == 1
+        assert coupling["posts.py"].afferent_coupling == 0
+        assert models.imported_by == ["/p/app/views.py"]
+
+
+class TestCoverageGap:
+
+    def test_matches_naming_calls_and_assertions(self, tmp_path: Path) -> None:
+        test_file = tmp_path / "test_app.py"
+        test_file.write_text(
+            "def test_parse_config():\n    pass\n\n"
+            "def test_other():\n    result = render (page)\n\n"
+            "def test_more():\n    value = compute\n    assert value\n"
+        )
+        names = ["parse_config", "render", "compute", "orphan", "parse"]
+        functions = [
+            FunctionMetrics(
+                name=name,
+                qualified_name=name,
+                file_path=tmp_path / "app.py",
+                line_start=1,
+                line_end=2,
+                language=Language.PYTHON,
+            )
+            for name in names
+        ]
+        lang = LanguageInfo(language=Language.PYTHON, existing_test_files=[test_file])
+
+        untested = find_untested_functions(functions, lang)
+
+        assert [f.name for f in untested] == ["orphan"]
+
+
+class TestDeadCode:
+
+    def test_counts_whole_word_references(self, tmp_path: Path) -> None:
+        source = tmp_path / "app.py"
+        source.write_text(
+            "def load(path):\n    return path\n\n"
+            "def unused_helper():\n    return load_all()\n\n"
+            "def run():\n    return load('x')\n"
+        )
+        functions = PythonParser().parse_functions(source)
+
+        dead = detect_dead_code(functions, [source])
+
+        assert sorted(f.name for f in dead) == ["run", "unused_helper"]
+
+
+class TestAnalysisEngine:
+
+    @pytest.mark.asyncio
+    async def test_process_pool_matches_inline(
+        self, mixed_project: Path, default_config: AutoTestConfig, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        default_config.analysis_cache = False
+        project = await ProjectScanner(default_config).scan(mixed_project)
+        engine = AnalysisEngine(default_config)
+
+        inline = await engine.analyze(project)
+        monkeypatch.setattr(analyzer_engine, "PARALLEL_ANALYSIS_MIN_FILES", 0)
+        pooled = await engine.analyze(project)
+
+        assert pooled.model_dump() == inline.model_dump()
+        assert inline.total_functions > 0
+
+    @pytest.mark.asyncio
+    async def test_unchanged_files_come_from_cache(
+        self, tmp_path: Path, default_config: AutoTestConfig, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        project_dir = tmp_path / "proj"
+        project_dir.mkdir()
+        (project_dir / "app.py").write_text("def add(a, b):\n    return a + b\n")
+        project = await ProjectScanner(default_config).scan(project_dir)
+        engine = AnalysisEngine(default_config)
+
+        first = await engine.analyze(project)
+
+        def fail(*args: object) -> None:
+            raise AssertionError("cached file was re-parsed")
+
+        monkeypatch.setattr(analyzer_engine, "_analyze_file", fail)
+        second = await engine.analyze(project)
+
+        assert second.model_dump() == first.model_dump()
+        assert (default_config.output_dir / ".autotest_cache.db").exists()
+
+    @pytest.mark.asyncio
+    async def test_cache_misses_when_language_changes(
+        self, tmp_path: Path, default_config: AutoTestConfig,
+    ) -> None:
+        source = tmp_path / "app.js"
+        source.write_text("function add(a, b) {\n  return a + b;\n}\n")
+        engine = AnalysisEngine(default_config)
+
+        [as_js] = await engine._load_modules([(source, Language.JAVASCRIPT)])
+        [as_ts] = await engine._load_modules([(source, Language.TYPESCRIPT)])
+        [cached_ts] = await engine._load_modules([(source, Language.TYPESCRIPT)])
+
+        assert as_js.language == Language.JAVASCRIPT
+        assert as_ts.language == Language.TYPESCRIPT
+        assert cached_ts.language == Language.TYPESCRIPT
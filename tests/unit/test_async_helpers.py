@@ -0,0 +1,46 @@
+"""Tests for async utilities."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from autotest.utils.async_helpers import AdmissionController
+
+
+class TestAdmissionController:
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self) -> None:
+        controller = AdmissionController(2)
+        active = 0
+        peak = 0
+
+        async def worker() -> None:
+            nonlocal active, peak
+            async with controller:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(worker() for _ in range(6)))
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_shrink_halves_limit(self) -> None:
+        controller = AdmissionController(4)
+        await controller.shrink()
+        assert controller.limit == 2
+        await controller.shrink()
+        await controller.shrink()
+        assert controller.limit == 1
+
+    @pytest.mark.asyncio
+    async def test_grows_back_to_ceiling(self) -> None:
+        controller = AdmissionController(4, grow_after=2)
+        await controller.shrink()
+        for _ in range(10):
+            await controller.record_success()
+        assert controller.limit == 4
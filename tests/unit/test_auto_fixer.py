@@ -109,3 +109,26 @@ class TestApplyFixes:
         ]
         report = apply_fixes(findings, tmp_path)
         assert report.applied_count == 2
+
+    def test_multiple_fixes_in_same_file(self, tmp_path: Path) -> None:
+        target = tmp_path / "settings.py"
+        target.write_text('password = "hunter2_long_pass"\ntoken = "tok_1234567890"\n')
+
+        findings = [
+            _make_finding_with_fix(
+                file_path="settings.py",
+                code_before='password = "hunter2_long_pass"',
+                code_after='password = os.environ["PASSWORD"]',
+            ),
+            _make_finding_with_fix(
+                file_path="settings.py",
+                code_before='token = "tok_1234567890"',
+                code_after='token = os.environ["TOKEN"]',
+            ),
+        ]
+        report = apply_fixes(findings, tmp_path)
+
+        assert report.applied_count == 2
+        assert target.read_text() == (
+            'password = os.environ["PASSWORD"]\ntoken = os.environ["TOKEN"]\n'
+        )
@@ -52,3 +52,22 @@ class TestLoadConfig:
         yaml_file.write_text(yaml_content)
         config = load_config(target_path=tmp_path)
         assert config.ai_enabled is False
+
+    def test_yaml_config_reloaded_after_edit(self, tmp_path: Path) -> None:
+        yaml_file = tmp_path / ".autotest.yaml"
+        yaml_file.write_text("top_findings: 3\n")
+        first = load_config(target_path=tmp_path)
+        first.severity_filter.append("info")
+
+        yaml_file.write_text("top_findings: 7\nseverity_filter:\n  - critical\n")
+        second = load_config(target_path=tmp_path)
+
+        assert first.top_findings == 3
+        assert second.top_findings == 7
+        assert second.severity_filter == ["critical"]
+
+    @pytest.mark.parametrize("content", ["tool = 1\n", "[tool]\nautotest = 1\n"])
+    def test_pyproject_non_table_sections_ignored(self, tmp_path: Path, content: str) -> None:
+        (tmp_path / "pyproject.toml").write_text(content)
+        config = load_config(target_path=tmp_path)
+        assert config.top_findings == AutoTestConfig().top_findings
@@ -8,6 +8,7 @@ from pathlib import Path
 import pytest
 
 from autotest.config import AutoTestConfig
+from autotest.detector.languages.python import _pyproject_dependencies
 from autotest.detector.scanner import ProjectScanner
 from autotest.models.project import Language
 
@@ -41,3 +42,53 @@ class TestProjectScanner:
     def test_project_name_from_path(self, scanner: ProjectScanner, python_project: Path) -> None:
         result = asyncio.run(scanner.scan(python_project))
         assert result.name == "python_project"
+
+    def test_python_frameworks_from_pyproject(
+        self, scanner: ProjectScanner, tmp_path: Path
+    ) -> None:
+        (tmp_path / "app.py").write_text("x = 1\n")
+        (tmp_path / "pyproject.toml").write_text(
+            '[project]\n'
+            'name = "svc"\n'
+            'dependencies = ["FastAPI[all]>=0.110", "pydantic"]\n'
+            '[project.optional-dependencies]\n'
+            'dev = ["pytest-cov"]\n'
+            '[tool.poetry.group.test.dependencies]\n'
+            'hypothesis = "^6"\n'
+        )
+        result = asyncio.run(scanner.scan(tmp_path))
+        python = result.languages[0]
+        assert "FastAPI" in [f.name for f in python.frameworks]
+        assert {"coverage", "hypothesis"} <= set(python.existing_test_tools)
+
+
+class TestPyprojectDependencies:
+
+    @pytest.mark.parametrize("content", [
+        'project = "x"\n',
+        '[project]\ndependencies = "requests"\n',
+        '[project]\noptional-dependencies = ["dev"]\n',
+        '[project.optional-dependencies]\ndev = "pytest"\n',
+        'tool = 1\n',
+        '[tool]\npoetry = "x"\n',
+        '[tool.poetry]\ngroup = 3\n',
+        '[tool.poetry.group]\ntest = "x"\n',
+        '[tool.poetry]\ndependencies = ["flask"]\n',
+        'not toml [',
+    ])
+    def test_malformed_tables_are_ignored(self, content: str) -> None:
+        assert _pyproject_dependencies(content) == set()
+
+    def test_valid_entries_survive_malformed_siblings(self) -> None:
+        content = (
+            '[project]\n'
+            'dependencies = ["Django>=4", 3]\n'
+            '[project.optional-dependencies]\n'
+            'dev = "pytest"\n'
+            'test = ["pytest-cov"]\n'
+            '[tool.poetry.group]\n'
+            'bad = 1\n'
+            '[tool.poetry.group.docs.dependencies]\n'
+            'sphinx = "^7"\n'
+        )
+        assert _pyproject_dependencies(content) == {"django", "pytest-cov", "sphinx"}
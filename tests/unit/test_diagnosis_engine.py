@@ -186,3 +186,19 @@ class TestDiagnoseIntegration:
 
         for i, f in enumerate(diagnosis.findings, start=1):
             assert f.id == f"CD-{i:03d}"
+
+    @pytest.mark.asyncio
+    async def test_reviewer_construction_failure_keeps_static_findings(
+        self, tmp_path: Path
+    ) -> None:
+        (tmp_path / "main.py").write_text('password = "super_secret_password_12345"\n')
+        config = AutoTestConfig(target_path=tmp_path, ai_enabled=True, ai_api_key="test-key")
+        engine = DiagnosisEngine(config)
+
+        with patch(
+            "autotest.diagnosis.engine.AICodeReviewer", side_effect=RuntimeError("bad client")
+        ):
+            diagnosis = await engine.diagnose(_make_project(tmp_path), _make_analysis())
+
+        assert diagnosis.ai_tokens_used == 0
+        assert any(f.category == FindingCategory.SECURITY for f in diagnosis.findings)
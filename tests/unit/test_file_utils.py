@@ -0,0 +1,110 @@
+"""Tests for file utilities."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from autotest.utils.file_utils import (
+    FileIndex,
+    collect_files,
+    count_lines,
+    find_files_by_pattern,
+    safe_read,
+    safe_read_lower,
+    total_lines,
+)
+
+
+class TestSafeRead:
+
+    def test_rereads_after_file_changes(self, tmp_path: Path) -> None:
+        f = tmp_path / "app.py"
+        f.write_text("x = 1\n")
+        assert safe_read(f) == "x = 1\n"
+
+        f.write_text("x = 1\ny = 2\n\n")
+        assert safe_read(f) == "x = 1\ny = 2\n\n"
+        assert count_lines(f) == 2
+
+    def test_missing_file_returns_empty(self, tmp_path: Path) -> None:
+        assert safe_read(tmp_path / "missing.py") == ""
+
+    def test_lower_tracks_file_changes(self, tmp_path: Path) -> None:
+        f = tmp_path / "app.csproj"
+        f.write_text("<PackageReference Include=\"xUnit\" />")
+        assert "xunit" in safe_read_lower(f)
+
+        f.write_text("<PackageReference Include=\"NUnit.Framework\" />\n")
+        assert safe_read_lower(f) == "<packagereference include=\"nunit.framework\" />\n"
+        assert safe_read_lower(tmp_path / "missing.csproj") == ""
+
+
+class TestTotalLines:
+
+    def test_sums_non_empty_lines_across_files(self, tmp_path: Path) -> None:
+        files = []
+        for i in range(5):
+            f = tmp_path / f"mod{i}.py"
+            f.write_text("a = 1\n\n" * (i + 1))
+            files.append(f)
+        assert total_lines(files) == 15
+
+
+class TestFindFilesByPattern:
+
+    def test_matches_like_rglob_outside_skip_dirs(self, tmp_path: Path) -> None:
+        for rel in [
+            "test_root.py",
+            "pkg/test_mod.py",
+            "pkg/mod_test.py",
+            "pkg/mod.py",
+            "tests/unit/helpers.py",
+            "pkg/test_b.txt",
+        ]:
+            f = tmp_path / rel
+            f.parent.mkdir(parents=True, exist_ok=True)
+            f.write_text("")
+
+        patterns = ["test_*.py", "*_test.py", "tests/**/*.py", "test_[ab].txt", "tests/**"]
+        found = find_files_by_pattern(tmp_path, patterns)
+
+        expected = {p for pattern in patterns for p in tmp_path.rglob(pattern) if p.is_file()}
+        assert set(found) == expected
+        assert sorted(f.relative_to(tmp_path).as_posix() for f in found) == [
+            "pkg/mod_test.py",
+            "pkg/test_b.txt",
+            "pkg/test_mod.py",
+            "test_root.py",
+            "tests/unit/helpers.py",
+        ]
+
+    def test_prunes_skip_and_hidden_dirs(self, tmp_path: Path) -> None:
+        for rel in [
+            "pkg/test_mod.py",
+            "node_modules/dep/test_dep.py",
+            ".venv/lib/test_site.py",
+            ".github/scripts/test_ci.py",
+        ]:
+            f = tmp_path / rel
+            f.parent.mkdir(parents=True, exist_ok=True)
+            f.write_text("")
+
+        found = find_files_by_pattern(tmp_path, ["test_*.py"])
+
+        assert [f.relative_to(tmp_path).as_posix() for f in found] == ["pkg/test_mod.py"]
+        assert FileIndex(tmp_path).find_files_by_pattern(["test_*.py"]) == found
+
+
+class TestFileIndex:
+
+    def test_lookups_match_direct_walks(self, tmp_path: Path) -> None:
+        for rel in ["app.py", "app.js", "lib/util.ts", "lib/util.test.ts", "build/out.js"]:
+            f = tmp_path / rel
+            f.parent.mkdir(parents=True, exist_ok=True)
+            f.write_text("")
+        index = FileIndex(tmp_path)
+
+        for exts in ({".py"}, {".js", ".ts"}, {".go"}):
+            assert index.collect_files(exts) == collect_files(tmp_path, exts)
+        patterns = ["*.test.ts", "*.spec.ts"]
+        assert index.find_files_by_pattern(patterns) == find_files_by_pattern(tmp_path, patterns)
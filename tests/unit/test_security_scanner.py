@@ -92,6 +92,16 @@ class TestScanForSecrets:
         findings = scan_for_secrets(tmp_path)
         assert len(findings) == 0
 
+    def test_reports_correct_line_after_prefilter(self, tmp_path: Path) -> None:
+        (tmp_path / "settings.py").write_text(
+            'DEBUG = True\n'
+            'NAME = "app"\n'
+            'Password = "supersecretvalue"\n'
+        )
+        findings = scan_for_secrets(tmp_path)
+        assert len(findings) == 1
+        assert findings[0].line_start == 3
+
 
 class TestIsTestFile:
 